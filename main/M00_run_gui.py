@@ -38,10 +38,12 @@ from pathlib import Path      # Offers an object-oriented interface for filesyst
 
 # ----------------------------------------------------------------------------------------------------
 # Ensure this module can import other "processes" packages by adding its parent folder to sys.path.
-# Also disable __pycache__ creation for cleaner deployments (especially when bundled with PyInstaller).
+# __pycache__ creation is disabled once in processes/__init__.py.
 # ----------------------------------------------------------------------------------------------------
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents _pycache_ creation
+# Only needed when run as a plain script; package imports (`python -m`, or M00 importing M01–M03)
+# already have the project root on sys.path.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 
 # ====================================================================================================
@@ -50,7 +52,7 @@ sys.dont_write_bytecode = True  # Prevents _pycache_ creation
 # Import all dependencies, GUI elements, and business logic modules.
 # ====================================================================================================
 # --- Central Package Hub ---
-from processes.P00_set_packages import * # Includes tkinter, ttk, messagebox, threading, etc.
+from processes.P00_set_packages import threading, traceback, messagebox
 
 # --- GUI Class ---
 from processes.P05_gui_elements import JustEatReconciliationGUI
@@ -32,8 +32,10 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
+# Only needed when run as a plain script; package imports (`python -m`, or M00 importing M01–M03)
+# already have the project root on sys.path.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 
 # ====================================================================================================
@@ -20,6 +20,11 @@
 #   - All amounts are stored as positive during parsing; refund/commission signs are applied later.
 #   - Commission and Marketing totals are adjusted to include VAT (20% uplift).
 #   - Statement file names are assumed to indicate Monday-start week (Mon → Sun).
+#   - This is the parser the GUI runs (M00 → run_je_parser). Statements are parsed in parallel
+#     worker processes (Section 5), with each statement's console output printed in input order.
+#   - Text extraction stays on pdfplumber (pages) + pdfminer (segment). The PDFium text, statement
+#     cache and fused regexes in scratchpad/SP1.py are NOT wired in here; port them deliberately, as
+#     build_dataframe() pairs descriptions with amounts by position and relies on pdfminer's layout.
 #
 # Author:         Gerry Pidgeon
 # Created:        2025-11-05
@@ -37,10 +42,12 @@ from pathlib import Path      # Offers an object-oriented interface for filesyst
 
 # ----------------------------------------------------------------------------------------------------
 # Ensure this module can import other "processes" packages by adding its parent folder to sys.path.
-# Also disable __pycache__ creation for cleaner deployments (especially when bundled with PyInstaller).
+# __pycache__ creation is disabled once in processes/__init__.py.
 # ----------------------------------------------------------------------------------------------------
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True
+# Only needed when run as a plain script; package imports (`python -m`, or M00 importing M01–M03)
+# already have the project root on sys.path.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 
 # ====================================================================================================
@@ -53,6 +60,7 @@ sys.dont_write_bytecode = True
 
 # Import the shared project-level package set (tkinter, pandas, pdfplumber, datetime, etc.)
 from processes.P00_set_packages import *
+from processes.P00_set_packages import pdfplumber, extract_text   # Lazily loaded by the hub, so not part of *
 
 # Import core path constants from P01
 from processes.P01_set_file_paths import (
@@ -412,7 +420,398 @@ def build_dataframe(descriptions, amounts):
 
 
 # ====================================================================================================
-# 5. MAIN PARSING FUNCTION
+# 5. PER-PDF PROCESSING
+# ----------------------------------------------------------------------------------------------------
+# Steps 4.1–9 for a single statement. These are top-level functions so that run_je_parser() can hand
+# them to ProcessPoolExecutor workers (picklable under Windows' spawn start method as well as fork).
+# ====================================================================================================
+def parse_statement(pdf_path: Path, gui_start=None, gui_end=None):
+    """
+    Parses one Just Eat statement PDF into its Orders, Refunds, Commission and Marketing rows.
+
+    Args:
+        pdf_path (Path):
+            Full filesystem path to a single "Just Eat Statement" PDF file.
+        gui_start (date, optional):
+            Inclusive start of the GUI-selected range (used by the header-date guard in STEP 4.4).
+        gui_end (date, optional):
+            Inclusive end of the GUI-selected range.
+
+    Returns:
+        pandas.DataFrame | None:
+            The combined rows for this statement, or None if the statement was skipped.
+
+    Notes:
+        - Also writes the statement's RefundDetails.csv (STEP 6.2) and prints its validation summary.
+    """
+    print(f"\n📄 Processing: {pdf_path.name}")
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 4.1 – Read and flatten all text content from the PDF
+    # ---------------------------------------------------------------------------------------------
+    # Purpose:
+    #   - Some JE statement content (e.g. totals, headings) spans multiple pages.
+    #   - pdfplumber reads text page-by-page; we merge into a single multiline string for parsing.
+    # ---------------------------------------------------------------------------------------------
+    with pdfplumber.open(pdf_path) as pdf:
+        full_text_pages = [p.extract_text() or "" for p in pdf.pages]
+    full_text = "\n".join(full_text_pages)
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 4.2 – Detect the statement period (start and end dates) printed in the PDF header
+    # ---------------------------------------------------------------------------------------------
+    # Purpose:
+    #   - JE uses varying header formats to show the statement range (Mon → Sun).
+    #   - We attempt multiple regex patterns to capture all variants.
+    # ---------------------------------------------------------------------------------------------
+    period_patterns = [
+        re.compile(
+            r"(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})\s*[-–to]+\s*(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})",
+            re.I
+        ),
+        re.compile(
+            r"(\d{1,2}/\d{1,2}/\d{2,4})\s*[-–to]+\s*(\d{1,2}/\d{1,2}/\d{2,4})",
+            re.I
+        ),
+    ]
+
+    m_period = None
+
+    # Loop through pages and patterns until a match is found
+    for page_text in full_text_pages:
+        for pat in period_patterns:
+            m_period = pat.search(page_text)
+            if m_period:
+                break
+        if m_period:
+            break
+
+    # Extract matched strings (if found)
+    statement_start_raw = m_period.group(1) if m_period else None
+    statement_end_raw   = m_period.group(2) if m_period else None
+
+    # Define an internal helper to handle multiple date formats gracefully
+    def parse_date_safe(date_str):
+        """
+        Convert various date formats to datetime.date safely.
+        Returns None if parsing fails.
+        """
+        if not date_str:
+            return None
+        for fmt in ("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d/%m/%y"):
+            try:
+                return datetime.strptime(date_str.strip(), fmt).date()
+            except Exception:
+                continue
+        return None
+
+    # Parse the detected raw header date strings
+    statement_start = parse_date_safe(statement_start_raw)
+    statement_end   = parse_date_safe(statement_end_raw)
+
+    # Guard clause — skip if header dates can’t be read
+    if not statement_start or not statement_end:
+        print("   ⚠ Could not extract statement period from PDF header → skipping file.")
+        return None
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 4.3 – Extract header-level summary metrics for validation
+    # ---------------------------------------------------------------------------------------------
+    # Purpose:
+    #   - Capture top-line figures printed in the PDF header for later comparison
+    #     against our parsed totals (sanity check).
+    #   - Includes:
+    #         • Number of Orders
+    #         • Total Sales
+    #         • “You will receive” payout amount
+    #         • Payment date
+    # ---------------------------------------------------------------------------------------------
+    orders_count_pat  = re.compile(r"Number\s+of\s+orders\s+([\d,]+)", re.I)
+    total_sales_pat   = re.compile(r"Total\s+sales.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
+    you_receive_pat   = re.compile(r"You\s+will\s+receive.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
+    payment_date_pat  = re.compile(r"paid\s+on\s+(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I)
+
+    # Run regex searches over the flattened text
+    m_orders  = orders_count_pat.search(full_text)
+    m_sales   = total_sales_pat.search(full_text)
+    m_recv    = you_receive_pat.search(full_text)
+    m_payment = payment_date_pat.search(full_text)
+
+    # Extract matched values, applying safe type conversions
+    reported_order_count = int(m_orders.group(1).replace(",", "")) if m_orders else None
+    reported_total_sales   = float(m_sales.group(1).replace(",", "")) if m_sales else None
+    reported_you_receive   = float(m_recv.group(1).replace(",", "")) if m_recv else None
+    payment_date_raw       = m_payment.group(1) if m_payment else None
+
+    # Attempt to parse payment date; tolerate missing or malformed formats
+    try:
+        payment_date = datetime.strptime(payment_date_raw, "%d %b %Y").date() if payment_date_raw else None
+    except Exception:
+        payment_date = None
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 4.4 – Final guard: skip statements that fall entirely outside the GUI range
+    # ---------------------------------------------------------------------------------------------
+    # Purpose:
+    #   - This is a more robust check using the *header dates* from within the PDF.
+    #   - Prevents parsing PDFs that lie completely outside the accounting
+    #     window selected in the GUI (e.g., if GUI is Oct, skip PDF for 2025-09-01).
+    # ---------------------------------------------------------------------------------------------
+    if gui_start and gui_end:
+        # Check for non-overlap: (End is before GUI start) OR (Start is after GUI end)
+        overlaps = not (statement_end < gui_start or statement_start > gui_end)
+        if not overlaps:
+            print(f"   ⏭ Skipped (statement {statement_start} → {statement_end} is outside selected range).")
+            return None
+
+    # =================================================================================================
+    # STEP 5: Extract individual ORDER lines
+    # =================================================================================================
+    # Purpose:
+    #   - Identify each individual order entry from the tabular section of the PDF.
+    #   - Each line includes date, order ID, type (e.g. “Order” or “Refund”), and £ value.
+    #   - This forms the foundation for order-level reconciliation with DWH data.
+    # -------------------------------------------------------------------------------------------------
+    line_prefix  = re.compile(r"^\s*\d+\s+(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([A-Za-z/&\-]+)\s+(.*)$", re.M)
+    money_finder = re.compile(r"[£]\s*([\d.,]+)")
+
+    orders_data  = []  # Temporary list to hold all order dictionaries before DataFrame conversion
+
+    for m in line_prefix.finditer(full_text):
+        # Extract components of each order line
+        date, order_id, order_type, tail = m.groups()
+
+        # Identify all £ amounts that appear on the same line
+        amts = money_finder.findall(tail)
+        if not amts:
+            continue  # Skip lines with no valid monetary values
+
+        # The last £ value is typically the total for that order
+        total = float(amts[-1].replace(",", ""))
+
+        # Append structured order entry to list
+        orders_data.append({
+            "order_id": order_id,
+            "date": date,
+            "order_type": order_type,
+            "total_incl_vat": total,
+            "refund_amount": 0.0,
+            "type": "Order",
+            "source_file": pdf_path.name,
+            "statement_start": statement_start,
+            "statement_end": statement_end,
+            "payment_date": payment_date,
+        })
+
+    # Convert the list of dicts → pandas DataFrame
+    orders_df            = pd.DataFrame(orders_data)
+    parsed_order_count = len(orders_df)
+    parsed_total_sales = round(orders_df["total_incl_vat"].sum(), 2)
+
+    # =================================================================================================
+    # STEP 6: Extract Refund, Commission and Marketing details
+    # =================================================================================================
+    # Purpose:
+    #   - Parse and structure the “Commission to Just Eat” section beneath the table.
+    #   - This section contains refunds, commission, and marketing deductions.
+    # -------------------------------------------------------------------------------------------------
+    seg          = get_segment_text(pdf_path)        # Extract text block between “Commission” and “Subtotal”
+    descriptions = extract_descriptions(seg)            # Clean multi-line refund/commission descriptions
+    amounts      = extract_amounts(seg)                 # Extract all £ amounts within that section
+    df_full      = build_dataframe(descriptions, amounts) # Combine into structured tabular format
+
+    # -------------------------------------------------------------------------------------------------
+    # STEP 6.1 – Derive grouped totals for Commission and Marketing
+    # -------------------------------------------------------------------------------------------------
+    # Identify text entries related to commission and marketing.
+    # Commission lines contain the word “Commission”; marketing are other untitled deductions.
+    commission_sum = df_full[
+        df_full["description"].str.contains("Commission", case=False, na=False)
+    ]["amount"].sum()
+
+    marketing_sum = df_full[
+        (~df_full["description"].str.contains("Commission", case=False, na=False)) &
+        (df_full["reason"].eq(""))  # Assumes marketing lines have no parsed 'reason'
+    ]["amount"].sum()
+
+    # Apply 20% VAT uplift and negative sign (to treat as cost deductions)
+    commission_incl_vat = round(commission_sum * 1.20 * -1, 2)
+    marketing_incl_vat  = round(marketing_sum  * 1.20 * -1, 2)
+
+    # -------------------------------------------------------------------------------------------------
+    # STEP 6.2 – Save per-statement refund-detail file (for audit / debugging)
+    # -------------------------------------------------------------------------------------------------
+    # Purpose:
+    #   - Each processed PDF generates its own RefundDetails.csv
+    #   - Provides full transparency of parsed refund/commission/marketing data.
+    # -------------------------------------------------------------------------------------------------
+    if not df_full.empty:
+        refund_csv_path = REFUND_FOLDER / f"{pdf_path.stem}_RefundDetails.csv"
+
+        # Attach metadata columns before export
+        (
+            df_full
+            .assign(
+                source_file=pdf_path.name,
+                statement_start=statement_start,
+                statement_end=statement_end,
+                payment_date=payment_date
+            )
+            .to_csv(refund_csv_path, index=False)
+        )
+
+        print(f"   💾 Saved refund detail file → {refund_csv_path.name}")
+
+    # =================================================================================================
+    # STEP 7: Aggregate refunds by order (for later joining to order lines)
+    # =================================================================================================
+    # Filter for "Outside the scope of VAT" (which are true refunds) and group by order ID
+    if not df_full.empty:
+        df_refunds_by_order = (
+            df_full[df_full["outside_scope"] & df_full["order_number"].ne("")]
+            .groupby("order_number", as_index=False)["amount"]
+            .sum()
+            .rename(columns={"order_number": "order_id"})
+        )
+    else:
+        df_refunds_by_order = pd.DataFrame(columns=["order_id", "amount"])
+
+    # =================================================================================================
+    # STEP 8: Combine Orders + Refunds + Commission + Marketing
+    # =================================================================================================
+    # Build a unified DataFrame for the current PDF by concatenating multiple components.
+    # Each “type” (Order / Refund / Commission / Marketing) represents one row category.
+    order_rows    = orders_df.copy()
+    combined_rows = [order_rows]  # Start list of DataFrames to concatenate later
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 8.1 – Add Refund rows if they exist
+    # ---------------------------------------------------------------------------------------------
+    if not df_refunds_by_order.empty:
+        refund_rows = df_refunds_by_order.copy()
+
+        # Refunds are stored as positive in the statement but must be negative for netting logic.
+        refund_rows["refund_amount"] = refund_rows["amount"].apply(lambda x: -x)
+        refund_rows["total_incl_vat"] = 0.0
+        refund_rows["type"] = "Refund"
+        refund_rows["date"] = statement_start
+        refund_rows["order_type"] = "Refund"
+        refund_rows["source_file"] = pdf_path.name
+        refund_rows["statement_start"] = statement_start
+        refund_rows["statement_end"] = statement_end
+        refund_rows["payment_date"] = payment_date
+        refund_rows.drop(columns=["amount"], inplace=True)
+        combined_rows.append(refund_rows)
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 8.2 – Add Commission summary row
+    # ---------------------------------------------------------------------------------------------
+    # A single aggregated line ensures the weekly deduction is captured in the dataset.
+    if commission_sum != 0:
+        combined_rows.append(pd.DataFrame([{
+            "order_id": "",
+            "date": statement_start,
+            "order_type": "Commission",
+            "refund_amount": 0.0,
+            "type": "Commission",
+            "total_incl_vat": commission_incl_vat,
+            "source_file": pdf_path.name,
+            "statement_start": statement_start,
+            "statement_end": statement_end,
+            "payment_date": payment_date
+        }]))
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 8.3 – Add Marketing summary row
+    # ---------------------------------------------------------------------------------------------
+    # A single aggregated line ensures the weekly deduction is captured in the dataset.
+    if marketing_sum != 0:
+        combined_rows.append(pd.DataFrame([{
+            "order_id": "",
+            "date": statement_start,
+            "order_type": "Marketing",
+            "refund_amount": 0.0,
+            "type": "Marketing",
+            "total_incl_vat": marketing_incl_vat,
+            "source_file": pdf_path.name,
+            "statement_start": statement_start,
+            "statement_end": statement_end,
+            "payment_date": payment_date
+        }]))
+
+    # Combine all per-statement components into a single DataFrame (returned after the summary below)
+    combined_df = pd.concat(combined_rows, ignore_index=True)
+
+    # =================================================================================================
+    # STEP 9: Per-statement validation summary
+    # =================================================================================================
+    # Purpose:
+    #   - Cross-check parsed totals (orders, refunds, commission, marketing)
+    #     against the official summary values printed in the statement header.
+    #   - Highlights discrepancies between parsed and reported amounts to help
+    #     identify OCR or parsing issues before consolidation.
+    # -------------------------------------------------------------------------------------------------
+    refund_sum_lines        = df_refunds_by_order["amount"].sum() if not df_refunds_by_order.empty else 0.0
+    subtotal_all            = df_full["amount"].sum() if not df_full.empty else 0.0
+    vat_deductions          = df_full.loc[~df_full["outside_scope"], "amount"].sum() if not df_full.empty else 0.0
+    refund_total_calc       = subtotal_all - vat_deductions # This is the "Subtotal" minus VAT-able items
+    refund_sum_lines_signed = -refund_sum_lines  # Flip sign for reconciliation logic
+
+    # Derive “You will receive” figure by summing all parsed components
+    derived_receive = None
+    diff_receive    = None
+    if reported_total_sales is not None and reported_you_receive is not None:
+        derived_receive = (
+            reported_total_sales
+            + refund_sum_lines_signed  # This is a negative value
+            + commission_incl_vat      # This is a negative value
+            + marketing_incl_vat       # This is a negative value
+        )
+        diff_receive = round(derived_receive - reported_you_receive, 2)
+
+    # Console output for quick validation of statement accuracy
+    print(f"   Header Orders: {reported_order_count:,} | Parsed Orders: {parsed_order_count:,} → Variance: {parsed_order_count - (reported_order_count or 0):+}")
+    print(f"   Header Total Sales: £{reported_total_sales:,.2f} | Parsed Total Sales: £{parsed_total_sales:,.2f} → Variance: £{parsed_total_sales - (reported_total_sales or 0):+.2f}")
+    print(f"   Header Refunds: £{refund_total_calc:,.2f} | Parsed Refunds: £{refund_sum_lines_signed:,.2f} → Variance: £{refund_sum_lines_signed + refund_total_calc:+.2f}")
+    print(f"   Header Payout: £{reported_you_receive:,.2f} | Parsed Payout: £{derived_receive:,.2f} → Variance: £{diff_receive:+.2f}")
+    print(f"   Commission + VAT uplift: £{commission_incl_vat:,.2f}")
+    print(f"   Marketing + VAT uplift:  £{marketing_incl_vat:,.2f}")
+    if reported_you_receive is not None:
+        print(f"   GoPuff will receive: £{reported_you_receive:,.2f}")
+    if payment_date:
+        print(f"   💰 Payment Date: {payment_date.strftime('%d %b %Y')}")
+
+    return combined_df
+
+
+def process_single_pdf(pdf_path: Path, gui_start=None, gui_end=None):
+    """
+    Runs `parse_statement()` for one PDF and captures everything it prints.
+
+    Args:
+        pdf_path (Path):
+            Full filesystem path to a single "Just Eat Statement" PDF file.
+        gui_start (date, optional):
+            Inclusive start of the GUI-selected range.
+        gui_end (date, optional):
+            Inclusive end of the GUI-selected range.
+
+    Returns:
+        tuple[pandas.DataFrame | None, str]:
+            The statement's combined rows (None if skipped) and its captured console output.
+
+    Notes:
+        - Output is buffered per PDF and printed by the parent in input order, so the console log of
+          a parallel run reads exactly like a serial one.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        combined_df = parse_statement(pdf_path, gui_start, gui_end)
+    return combined_df, buf.getvalue()
+
+
+# ====================================================================================================
+# 6. MAIN PARSING FUNCTION
 # ====================================================================================================
 def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None, end_date: str = None):
     """
@@ -547,347 +946,24 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
     # =================================================================================================
     # STEP 4: Loop through each valid PDF and extract all required details
     # =================================================================================================
-    # Each PDF is parsed independently, producing a structured DataFrame that will later be merged.
+    # Each PDF is parsed independently (Steps 4.1–9 in parse_statement()), so statements are spread
+    # across worker processes: pdfminer/pdfplumber text extraction is CPU-bound pure Python.
+    # Results (and their buffered console output) are consumed in input order, matching a serial run.
     all_rows = []  # Collects DataFrames for final consolidation
 
-    for pdf_path in pdf_files:
-        print(f"\n📄 Processing: {pdf_path.name}")
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 4.1 – Read and flatten all text content from the PDF
-        # ---------------------------------------------------------------------------------------------
-        # Purpose:
-        #   - Some JE statement content (e.g. totals, headings) spans multiple pages.
-        #   - pdfplumber reads text page-by-page; we merge into a single multiline string for parsing.
-        # ---------------------------------------------------------------------------------------------
-        with pdfplumber.open(pdf_path) as pdf:
-            full_text_pages = [p.extract_text() or "" for p in pdf.pages]
-        full_text = "\n".join(full_text_pages)
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 4.2 – Detect the statement period (start and end dates) printed in the PDF header
-        # ---------------------------------------------------------------------------------------------
-        # Purpose:
-        #   - JE uses varying header formats to show the statement range (Mon → Sun).
-        #   - We attempt multiple regex patterns to capture all variants.
-        # ---------------------------------------------------------------------------------------------
-        period_patterns = [
-            re.compile(
-                r"(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})\s*[-–to]+\s*(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})",
-                re.I
-            ),
-            re.compile(
-                r"(\d{1,2}/\d{1,2}/\d{2,4})\s*[-–to]+\s*(\d{1,2}/\d{1,2}/\d{2,4})",
-                re.I
-            ),
-        ]
-
-        m_period = None
-
-        # Loop through pages and patterns until a match is found
-        for page_text in full_text_pages:
-            for pat in period_patterns:
-                m_period = pat.search(page_text)
-                if m_period:
-                    break
-            if m_period:
-                break
-
-        # Extract matched strings (if found)
-        statement_start_raw = m_period.group(1) if m_period else None
-        statement_end_raw   = m_period.group(2) if m_period else None
-
-        # Define an internal helper to handle multiple date formats gracefully
-        def parse_date_safe(date_str):
-            """
-            Convert various date formats to datetime.date safely.
-            Returns None if parsing fails.
-            """
-            if not date_str:
-                return None
-            for fmt in ("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d/%m/%y"):
-                try:
-                    return datetime.strptime(date_str.strip(), fmt).date()
-                except Exception:
-                    continue
-            return None
-
-        # Parse the detected raw header date strings
-        statement_start = parse_date_safe(statement_start_raw)
-        statement_end   = parse_date_safe(statement_end_raw)
-
-        # Guard clause — skip if header dates can’t be read
-        if not statement_start or not statement_end:
-            print("   ⚠ Could not extract statement period from PDF header → skipping file.")
-            continue
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 4.3 – Extract header-level summary metrics for validation
-        # ---------------------------------------------------------------------------------------------
-        # Purpose:
-        #   - Capture top-line figures printed in the PDF header for later comparison
-        #     against our parsed totals (sanity check).
-        #   - Includes:
-        #         • Number of Orders
-        #         • Total Sales
-        #         • “You will receive” payout amount
-        #         • Payment date
-        # ---------------------------------------------------------------------------------------------
-        orders_count_pat  = re.compile(r"Number\s+of\s+orders\s+([\d,]+)", re.I)
-        total_sales_pat   = re.compile(r"Total\s+sales.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
-        you_receive_pat   = re.compile(r"You\s+will\s+receive.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
-        payment_date_pat  = re.compile(r"paid\s+on\s+(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I)
-
-        # Run regex searches over the flattened text
-        m_orders  = orders_count_pat.search(full_text)
-        m_sales   = total_sales_pat.search(full_text)
-        m_recv    = you_receive_pat.search(full_text)
-        m_payment = payment_date_pat.search(full_text)
-
-        # Extract matched values, applying safe type conversions
-        reported_order_count = int(m_orders.group(1).replace(",", "")) if m_orders else None
-        reported_total_sales   = float(m_sales.group(1).replace(",", "")) if m_sales else None
-        reported_you_receive   = float(m_recv.group(1).replace(",", "")) if m_recv else None
-        payment_date_raw       = m_payment.group(1) if m_payment else None
-
-        # Attempt to parse payment date; tolerate missing or malformed formats
-        try:
-            payment_date = datetime.strptime(payment_date_raw, "%d %b %Y").date() if payment_date_raw else None
-        except Exception:
-            payment_date = None
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 4.4 – Final guard: skip statements that fall entirely outside the GUI range
-        # ---------------------------------------------------------------------------------------------
-        # Purpose:
-        #   - This is a more robust check using the *header dates* from within the PDF.
-        #   - Prevents parsing PDFs that lie completely outside the accounting
-        #     window selected in the GUI (e.g., if GUI is Oct, skip PDF for 2025-09-01).
-        # ---------------------------------------------------------------------------------------------
-        if gui_start and gui_end:
-            # Check for non-overlap: (End is before GUI start) OR (Start is after GUI end)
-            overlaps = not (statement_end < gui_start or statement_start > gui_end)
-            if not overlaps:
-                print(f"   ⏭ Skipped (statement {statement_start} → {statement_end} is outside selected range).")
-                continue
-
-        # =================================================================================================
-        # STEP 5: Extract individual ORDER lines
-        # =================================================================================================
-        # Purpose:
-        #   - Identify each individual order entry from the tabular section of the PDF.
-        #   - Each line includes date, order ID, type (e.g. “Order” or “Refund”), and £ value.
-        #   - This forms the foundation for order-level reconciliation with DWH data.
-        # -------------------------------------------------------------------------------------------------
-        line_prefix  = re.compile(r"^\s*\d+\s+(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([A-Za-z/&\-]+)\s+(.*)$", re.M)
-        money_finder = re.compile(r"[£]\s*([\d.,]+)")
-
-        orders_data  = []  # Temporary list to hold all order dictionaries before DataFrame conversion
-
-        for m in line_prefix.finditer(full_text):
-            # Extract components of each order line
-            date, order_id, order_type, tail = m.groups()
-
-            # Identify all £ amounts that appear on the same line
-            amts = money_finder.findall(tail)
-            if not amts:
-                continue  # Skip lines with no valid monetary values
-
-            # The last £ value is typically the total for that order
-            total = float(amts[-1].replace(",", ""))
-
-            # Append structured order entry to list
-            orders_data.append({
-                "order_id": order_id,
-                "date": date,
-                "order_type": order_type,
-                "total_incl_vat": total,
-                "refund_amount": 0.0,
-                "type": "Order",
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date,
-            })
-
-        # Convert the list of dicts → pandas DataFrame
-        orders_df            = pd.DataFrame(orders_data)
-        parsed_order_count = len(orders_df)
-        parsed_total_sales = round(orders_df["total_incl_vat"].sum(), 2)
-
-        # =================================================================================================
-        # STEP 6: Extract Refund, Commission and Marketing details
-        # =================================================================================================
-        # Purpose:
-        #   - Parse and structure the “Commission to Just Eat” section beneath the table.
-        #   - This section contains refunds, commission, and marketing deductions.
-        # -------------------------------------------------------------------------------------------------
-        seg          = get_segment_text(pdf_path)        # Extract text block between “Commission” and “Subtotal”
-        descriptions = extract_descriptions(seg)            # Clean multi-line refund/commission descriptions
-        amounts      = extract_amounts(seg)                 # Extract all £ amounts within that section
-        df_full      = build_dataframe(descriptions, amounts) # Combine into structured tabular format
-
-        # -------------------------------------------------------------------------------------------------
-        # STEP 6.1 – Derive grouped totals for Commission and Marketing
-        # -------------------------------------------------------------------------------------------------
-        # Identify text entries related to commission and marketing.
-        # Commission lines contain the word “Commission”; marketing are other untitled deductions.
-        commission_sum = df_full[
-            df_full["description"].str.contains("Commission", case=False, na=False)
-        ]["amount"].sum()
-
-        marketing_sum = df_full[
-            (~df_full["description"].str.contains("Commission", case=False, na=False)) &
-            (df_full["reason"].eq(""))  # Assumes marketing lines have no parsed 'reason'
-        ]["amount"].sum()
-
-        # Apply 20% VAT uplift and negative sign (to treat as cost deductions)
-        commission_incl_vat = round(commission_sum * 1.20 * -1, 2)
-        marketing_incl_vat  = round(marketing_sum  * 1.20 * -1, 2)
-
-        # -------------------------------------------------------------------------------------------------
-        # STEP 6.2 – Save per-statement refund-detail file (for audit / debugging)
-        # -------------------------------------------------------------------------------------------------
-        # Purpose:
-        #   - Each processed PDF generates its own RefundDetails.csv
-        #   - Provides full transparency of parsed refund/commission/marketing data.
-        # -------------------------------------------------------------------------------------------------
-        if not df_full.empty:
-            refund_csv_path = REFUND_FOLDER / f"{pdf_path.stem}_RefundDetails.csv"
-
-            # Attach metadata columns before export
-            (
-                df_full
-                .assign(
-                    source_file=pdf_path.name,
-                    statement_start=statement_start,
-                    statement_end=statement_end,
-                    payment_date=payment_date
-                )
-                .to_csv(refund_csv_path, index=False)
-            )
-
-            print(f"   💾 Saved refund detail file → {refund_csv_path.name}")
-
-        # =================================================================================================
-        # STEP 7: Aggregate refunds by order (for later joining to order lines)
-        # =================================================================================================
-        # Filter for "Outside the scope of VAT" (which are true refunds) and group by order ID
-        if not df_full.empty:
-            df_refunds_by_order = (
-                df_full[df_full["outside_scope"] & df_full["order_number"].ne("")]
-                .groupby("order_number", as_index=False)["amount"]
-                .sum()
-                .rename(columns={"order_number": "order_id"})
-            )
+    n_pdfs = len(pdf_files)
+    with contextlib.ExitStack() as stack:
+        if n_pdfs > 1:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=min(n_pdfs, os.cpu_count() or 1)))
+            results = ex.map(process_single_pdf, pdf_files, [gui_start] * n_pdfs, [gui_end] * n_pdfs)
         else:
-            df_refunds_by_order = pd.DataFrame(columns=["order_id", "amount"])
-
-        # =================================================================================================
-        # STEP 8: Combine Orders + Refunds + Commission + Marketing
-        # =================================================================================================
-        # Build a unified DataFrame for the current PDF by concatenating multiple components.
-        # Each “type” (Order / Refund / Commission / Marketing) represents one row category.
-        order_rows    = orders_df.copy()
-        combined_rows = [order_rows]  # Start list of DataFrames to concatenate later
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 8.1 – Add Refund rows if they exist
-        # ---------------------------------------------------------------------------------------------
-        if not df_refunds_by_order.empty:
-            refund_rows = df_refunds_by_order.copy()
-
-            # Refunds are stored as positive in the statement but must be negative for netting logic.
-            refund_rows["refund_amount"] = refund_rows["amount"].apply(lambda x: -x)
-            refund_rows["total_incl_vat"] = 0.0
-            refund_rows["type"] = "Refund"
-            refund_rows["date"] = statement_start
-            refund_rows["order_type"] = "Refund"
-            refund_rows["source_file"] = pdf_path.name
-            refund_rows["statement_start"] = statement_start
-            refund_rows["statement_end"] = statement_end
-            refund_rows["payment_date"] = payment_date
-            refund_rows.drop(columns=["amount"], inplace=True)
-            combined_rows.append(refund_rows)
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 8.2 – Add Commission summary row
-        # ---------------------------------------------------------------------------------------------
-        # A single aggregated line ensures the weekly deduction is captured in the dataset.
-        if commission_sum != 0:
-            combined_rows.append(pd.DataFrame([{
-                "order_id": "",
-                "date": statement_start,
-                "order_type": "Commission",
-                "refund_amount": 0.0,
-                "type": "Commission",
-                "total_incl_vat": commission_incl_vat,
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date
-            }]))
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 8.3 – Add Marketing summary row
-        # ---------------------------------------------------------------------------------------------
-        # A single aggregated line ensures the weekly deduction is captured in the dataset.
-        if marketing_sum != 0:
-            combined_rows.append(pd.DataFrame([{
-                "order_id": "",
-                "date": statement_start,
-                "order_type": "Marketing",
-                "refund_amount": 0.0,
-                "type": "Marketing",
-                "total_incl_vat": marketing_incl_vat,
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date
-            }]))
-
-        # Combine all per-statement components into a single DataFrame
-        combined_df = pd.concat(combined_rows, ignore_index=True)
-        all_rows.append(combined_df)
-
-        # =================================================================================================
-        # STEP 9: Per-statement validation summary
-        # =================================================================================================
-        # Purpose:
-        #   - Cross-check parsed totals (orders, refunds, commission, marketing)
-        #     against the official summary values printed in the statement header.
-        #   - Highlights discrepancies between parsed and reported amounts to help
-        #     identify OCR or parsing issues before consolidation.
-        # -------------------------------------------------------------------------------------------------
-        refund_sum_lines        = df_refunds_by_order["amount"].sum() if not df_refunds_by_order.empty else 0.0
-        subtotal_all            = df_full["amount"].sum() if not df_full.empty else 0.0
-        vat_deductions          = df_full.loc[~df_full["outside_scope"], "amount"].sum() if not df_full.empty else 0.0
-        refund_total_calc       = subtotal_all - vat_deductions # This is the "Subtotal" minus VAT-able items
-        refund_sum_lines_signed = -refund_sum_lines  # Flip sign for reconciliation logic
-
-        # Derive “You will receive” figure by summing all parsed components
-        derived_receive = None
-        diff_receive    = None
-        if reported_total_sales is not None and reported_you_receive is not None:
-            derived_receive = (
-                reported_total_sales
-                + refund_sum_lines_signed  # This is a negative value
-                + commission_incl_vat      # This is a negative value
-                + marketing_incl_vat       # This is a negative value
-            )
-            diff_receive = round(derived_receive - reported_you_receive, 2)
-
-        # Console output for quick validation of statement accuracy
-        print(f"   Header Orders: {reported_order_count:,} | Parsed Orders: {parsed_order_count:,} → Variance: {parsed_order_count - (reported_order_count or 0):+}")
-        print(f"   Header Total Sales: £{reported_total_sales:,.2f} | Parsed Total Sales: £{parsed_total_sales:,.2f} → Variance: £{parsed_total_sales - (reported_total_sales or 0):+.2f}")
-        print(f"   Header Refunds: £{refund_total_calc:,.2f} | Parsed Refunds: £{refund_sum_lines_signed:,.2f} → Variance: £{refund_sum_lines_signed + refund_total_calc:+.2f}")
-        print(f"   Header Payout: £{reported_you_receive:,.2f} | Parsed Payout: £{derived_receive:,.2f} → Variance: £{diff_receive:+.2f}")
-        print(f"   Commission + VAT uplift: £{commission_incl_vat:,.2f}")
-        print(f"   Marketing + VAT uplift:  £{marketing_incl_vat:,.2f}")
-        if reported_you_receive is not None:
-            print(f"   GoPuff will receive: £{reported_you_receive:,.2f}")
-        if payment_date:
-            print(f"   💰 Payment Date: {payment_date.strftime('%d %b %Y')}")
+            # A single statement gains nothing from a worker process, so it is parsed in-process
+            results = map(process_single_pdf, pdf_files, [gui_start] * n_pdfs, [gui_end] * n_pdfs)
+
+        for combined_df, log_text in results:
+            print(log_text, end="")
+            if combined_df is not None:
+                all_rows.append(combined_df)
 
     # =================================================================================================
     # STEP 10: Final merge and save consolidated output
@@ -978,7 +1054,7 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
 
 
 # ====================================================================================================
-# 6. MAIN EXECUTION BLOCK
+# 7. MAIN EXECUTION BLOCK
 # ====================================================================================================
 # Purpose:
 #   - Allows the module to run independently for direct testing outside the GUI framework.
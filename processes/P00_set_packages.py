@@ -30,14 +30,12 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
-
 
 # ====================================================================================================
 # 2. PROJECT IMPORTS
@@ -48,27 +46,32 @@ sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being create
 
 # ----------------------------------------------------------------------------------------------------
 # --- Standard library imports (no installation required) ---
+# `sys` and `Path` are already imported in Section 1 and are re-exported from there.
 # ----------------------------------------------------------------------------------------------------
 import os                                                       # OS-level operations (paths, environment variables)
 import io                                                       # Handle in-memory file-like streams (e.g., StringIO)
 import re                                                       # Regular expressions for pattern matching
-import sys                                                      # Access system-specific parameters, e.g., sys.path
 import csv                                                      # Read/write CSV files natively
 import time                                                     # Time utilities (sleep, timestamps, timing performance)
 import json                                                     # Read/write JSON files for configs or structured data
 import glob                                                     # Pattern-based file searches (e.g., *.csv, *.py)
+import fnmatch                                                  # Glob-style filename matching (e.g., for os.scandir entries)
+import hashlib                                                  # Fast content hashes (e.g., blake2b cache keys for PDFs)
 import shutil                                                   # File operations: copy, move, delete
 import getpass                                                  # Retrieve current OS username securely
 import logging                                                  # Standard logging for info/warning/error tracking
 import threading                                                # Run lightweight concurrent tasks
+import queue                                                    # Thread-safe queues (e.g., worker thread → Tk main loop)
+import traceback                                                # Format full tracebacks for error dialogs
 import contextlib                                               # Manage temporary context scopes (e.g., redirect_stdout)
 import tkinter as tk                                            # Standard Python GUI toolkit
+import tkinter.font as tkfont                                   # Named Font objects shared across Tk widgets
 import datetime as dt                                           # Shortcut alias for datetime module (used as dt.date / dt.datetime)
 import calendar                                                 # Calendar operations (e.g., month ranges, weekday checks)
 from datetime import date, datetime, timedelta                  # Work with dates and times
 import subprocess                                               # Run external system commands (e.g., open, xdg-open)
-from pathlib import Path                                        # Cross-platform, object-oriented path handling
 from functools import lru_cache, partial                        # Memoization + preconfigured function wrappers
+from concurrent.futures import ProcessPoolExecutor              # Run CPU-bound work (e.g., PDF parsing) across processes
 from typing import Iterable, Callable, Optional, List, Dict     # Type hints for clean function signatures
 from dataclasses import dataclass                               # Lightweight class creation (auto __init__, __repr__, etc.)
 from tkinter import ttk, messagebox, filedialog                 # Tkinter extras: themed widgets, popup dialogs, file picker
@@ -86,10 +89,13 @@ warnings.filterwarnings("ignore", category=UserWarning)         # Suppress noisy
 # ----------------------------------------------------------------------------------------------------
 import pandas as pd                                             # (pip install pandas) Data analysis and manipulation
 import numpy as np                                              # (installed with pandas) Numerical arrays, fast math ops
-import pdfplumber                                               # (pip install pdfplumber) Extract text/tables from PDF files accurately
-from pdfminer.high_level import extract_text                    # (installed with pdfplumber) Fallback PDF text extraction if pdfplumber fails
-from tkcalendar import DateEntry                                # (pip install tkcalendar) Calendar drop down for GUI element
+# pdfplumber / pdfminer's extract_text are loaded lazily (see the end of this file)
+try:
+    import pypdfium2 as pdfium                                  # (installed with pdfplumber) Native PDFium text extraction (fast path)
+except ImportError:
+    pdfium = None                                               # Callers fall back to pdfminer's extract_text
 import snowflake.connector                                      # (pip install snowflake-connector-python) Run SQL in Snowflake
+# watchdog's Observer (optional, GUI only) is loaded lazily (see the end of this file)
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -108,3 +114,36 @@ logging.basicConfig(
     format="%(asctime)s | %(levelname)-8s | %(message)s",       # Timestamp + level + message layout
     datefmt="%Y-%m-%d %H:%M:%S"                                 # Standard timestamp format
 )
+
+
+# ----------------------------------------------------------------------------------------------------
+# Lazily-loaded dependencies
+# ----------------------------------------------------------------------------------------------------
+# `tkcalendar` (and its Babel locale data) and `watchdog` are only needed when the GUI is built, and
+# `pdfplumber` (which pulls in pdfminer) only when a PDF is actually parsed, so these are resolved on
+# first access rather than at import time. They are NOT included in `import *`; use an explicit
+# import, e.g.:
+#   from processes.P00_set_packages import DateEntry, Observer   # Observer is None without watchdog
+#   from processes.P00_set_packages import pdfplumber, extract_text
+# ----------------------------------------------------------------------------------------------------
+def __getattr__(name):
+    if name == "DateEntry":
+        from tkcalendar import DateEntry                        # (pip install tkcalendar) Calendar drop down for GUI element
+        globals()["DateEntry"] = DateEntry
+        return DateEntry
+    if name == "Observer":
+        try:
+            from watchdog.observers import Observer             # (pip install watchdog) Filesystem event notifications
+        except ImportError:
+            Observer = None                                     # Optional: the GUI falls back to on-demand folder scans
+        globals()["Observer"] = Observer
+        return Observer
+    if name == "pdfplumber":
+        import pdfplumber                                       # (pip install pdfplumber) Extract text/tables from PDF files accurately
+        globals()["pdfplumber"] = pdfplumber
+        return pdfplumber
+    if name == "extract_text":
+        from pdfminer.high_level import extract_text            # (installed with pdfplumber) Fallback PDF text extraction if pdfplumber fails
+        globals()["extract_text"] = extract_text
+        return extract_text
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
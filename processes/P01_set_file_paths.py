@@ -34,13 +34,9 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
 
 
 # ====================================================================================================
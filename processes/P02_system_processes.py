@@ -27,13 +27,9 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
 
 
 # ====================================================================================================
@@ -136,6 +132,7 @@ def user_download_folder() -> Path:
 # 5. MAIN EXECUTION (STANDALONE TEST)
 # ----------------------------------------------------------------------------------------------------
 # Allows the module to be run directly to verify OS detection.
+# Run from the project root with: python -m processes.P02_system_processes
 # ====================================================================================================
 if __name__ == "__main__":
     print(f"Detected OS: {detect_os()}")
@@ -28,13 +28,9 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
 
 
 # ====================================================================================================
@@ -44,6 +40,9 @@ sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being create
 # ====================================================================================================
 from processes.P00_set_packages import *
 
+# Diagnostics are logged at DEBUG so callers on the GUI thread skip the console write unless enabled
+log = logging.getLogger("je_recon.shared")
+
 
 # ====================================================================================================
 # 3. DATE RANGE OVERLAP CHECK
@@ -82,7 +81,84 @@ def statement_overlaps_file(file_start: str, file_end: str, gui_start: str, gui_
 # Used to determine statement coverage and missing accrual periods.
 # ====================================================================================================
 
-def get_je_statement_coverage(statement_folder: Path, acc_start: date, acc_end: date):
+# Fallback pattern for oddly-shaped filenames (e.g. 4-digit years or a non-leading date)
+_JE_STMT_RE = re.compile(r"(\d{2,4})[.\-](\d{2})[.\-](\d{2}).*JE Statement\.pdf$", re.I)
+
+# Above this many statements, the overlap window is resolved with NumPy instead of a Python loop
+_VECTORISE_THRESHOLD = 500
+
+
+def _try_fast_parse(name: str):
+    """
+    Parse the (YY, MM, DD) prefix of a standard JE statement filename without using regex.
+
+    Args:
+        name (str): Filename such as "25.06.02 - JE Statement.pdf".
+
+    Returns:
+        tuple[int, int, int] | None: (yy, mm, dd) if the name has the standard shape, otherwise None
+            so the caller can fall back to `_JE_STMT_RE`.
+    """
+    if (
+        len(name) >= 8
+        and name[2] in ".-"
+        and name[5] in ".-"
+        and name[0:2].isdecimal()
+        and name[3:5].isdecimal()
+        and name[6:8].isdecimal()
+        and name.lower().endswith("je statement.pdf")
+    ):
+        return int(name[0:2]), int(name[3:5]), int(name[6:8])
+    return None
+
+
+def _overlap_range_vectorised(keys: list, window_open: date, acc_end: date):
+    """
+    Resolve the first and last overlapping statement Mondays for large folders using NumPy.
+
+    Args:
+        keys (list[tuple[int, int, int]]): Unsorted (year, month, day) statement start dates.
+        window_open (date): Earliest start date that still overlaps the window (acc_start - 6 days).
+        acc_end (date): Accounting period end date.
+
+    Returns:
+        tuple[date|None, date|None]: (first_monday, last_monday), or (None, None) if none overlap.
+    """
+    arr = np.array(keys, dtype=np.int64)
+    years, months, days = arr[:, 0], arr[:, 1], arr[:, 2]
+
+    # Build datetime64[D] values as year offset → month offset → day offset (proleptic Gregorian)
+    starts = (
+        (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + (months - 1)
+    ).astype("datetime64[D]") + (days - 1)
+
+    kept = starts[(starts >= np.datetime64(window_open)) & (starts <= np.datetime64(acc_end))]
+    if kept.size == 0:
+        return None, None
+    return kept.min().astype(object), kept.max().astype(object)
+
+
+def _iter_folder_names(folder: Path):
+    """
+    Yield the entry names of a folder via os.scandir (nothing if the folder does not exist).
+
+    Args:
+        folder (Path): Folder to list.
+
+    Yields:
+        str: Entry name (no Path objects are built).
+    """
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                yield entry.name
+    except FileNotFoundError:
+        return
+
+
+def get_je_statement_coverage(
+    statement_folder: Path, acc_start: date, acc_end: date, names: Optional[Iterable[str]] = None
+):
     """
     Determine the first and last Monday (statement start dates) for all JE statement PDFs
     that overlap with the selected accounting period.
@@ -91,6 +167,8 @@ def get_je_statement_coverage(statement_folder: Path, acc_start: date, acc_end:
         statement_folder (Path): Folder containing JE statement PDFs.
         acc_start (date): Accounting period start date (YYYY-MM-DD from GUI).
         acc_end (date): Accounting period end date (YYYY-MM-DD from GUI).
+        names (Iterable[str], optional): Filenames the caller has already listed from
+            `statement_folder`. When given, the folder is not scanned again.
 
     Returns:
         tuple[date|None, date|None]: (first_monday, last_monday)
@@ -98,39 +176,58 @@ def get_je_statement_coverage(statement_folder: Path, acc_start: date, acc_end:
             - Returns (None, None) if no statements overlap.
     """
 
-    # Regex pattern to extract date from filenames like "25.06.23 - JE Statement.pdf"
-    pattern = re.compile(r"(\d{2,4})[.\-](\d{2})[.\-](\d{2}).*JE Statement\.pdf$", re.I)
-
-    mondays_in_period = []
+    # Collect (year, month, day) keys for every JE statement PDF in the folder.
+    # os.scandir avoids building a Path per entry; fnmatch applies the same matching rules as glob.
+    if names is None:
+        names = _iter_folder_names(statement_folder)
 
-    # Loop through all JE statement PDFs in the folder
-    for pdf_path in statement_folder.glob("*JE Statement*.pdf"):
-        m = pattern.search(pdf_path.name)
-        if not m:
+    keys = []
+    for name in names:
+        if not fnmatch.fnmatch(name, "*JE Statement*.pdf"):
             continue
 
-        # Convert filename date (always Monday) to datetime.date object
-        yy = int(m.group(1))
-        yy = yy if yy > 99 else int("20" + f"{yy:02d}")
-        mm = int(m.group(2))
-        dd = int(m.group(3))
-        week_start = date(yy, mm, dd)
-        week_end = week_start + timedelta(days=6)
-
-        # Check if statement week overlaps the accounting window
-        if not (week_end < acc_start or week_start > acc_end):
-            mondays_in_period.append(week_start)
+        # Standard "YY.MM.DD - JE Statement.pdf" names are sliced directly; others fall back to regex
+        parsed = _try_fast_parse(name)
+        if parsed is None:
+            m = _JE_STMT_RE.search(name)
+            if not m:
+                continue
+            parsed = (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+        yy, mm, dd = parsed
+        keys.append((yy if yy > 99 else 2000 + yy, mm, dd))
+
+    # A Monday → Sunday week overlaps the window if it starts within [acc_start - 6 days, acc_end]
+    window_open = acc_start - timedelta(days=6)
+
+    if len(keys) > _VECTORISE_THRESHOLD:
+        # Large archives: one vectorised mask + min/max instead of a per-file loop
+        first_monday, last_monday = _overlap_range_vectorised(keys, window_open, acc_end)
+    else:
+        # Sort chronologically so the scan can stop at the first statement starting after the window.
+        # Keys are compared as (year, month, day) tuples rather than raw names, since separators and
+        # 4-digit years would otherwise break lexicographic ordering.
+        keys.sort()
+        lo = (window_open.year, window_open.month, window_open.day)
+        hi = (acc_end.year, acc_end.month, acc_end.day)
+
+        first_monday, last_monday = None, None
+        for key in keys:
+            if key < lo:
+                continue  # Week ends before the accounting window (no date object needed)
+            if key > hi:
+                break  # Every remaining statement starts after the accounting window
+            week_start = date(*key)
+            if first_monday is None:
+                first_monday = week_start
+            last_monday = week_start
 
     # Handle case where no statements fall within range
-    if not mondays_in_period:
-        print(f"⚠ No JE statements overlap {acc_start} → {acc_end} in {statement_folder}")
+    if first_monday is None:
+        log.debug("No JE statements overlap %s → %s in %s", acc_start, acc_end, statement_folder)
         return None, None
 
-    # Identify the first and last overlapping Monday
-    first_monday = min(mondays_in_period)
-    last_monday = max(mondays_in_period)
-
-    print(f"📅 Overlapping JE statements: {first_monday} → {last_monday}")
+    log.debug("Overlapping JE statements: %s → %s", first_monday, last_monday)
 
     return first_monday, last_monday
 
@@ -139,6 +236,7 @@ def get_je_statement_coverage(statement_folder: Path, acc_start: date, acc_end:
 # 5. MODULE TEST (STANDALONE EXECUTION)
 # ----------------------------------------------------------------------------------------------------
 # Allows this module to be executed directly for quick verification.
+# Run from the project root with: python -m processes.P03_shared_functions
 # ====================================================================================================
 if __name__ == "__main__":
     test_folder = Path.cwd() / "02 PDFs"
@@ -18,6 +18,7 @@
 # Notes:
 #   - All DWH columns have been converted to lowercase for standardization.
 #   - Mappings are used in reconciliation scripts to ensure uniform schema across sources.
+#   - Public maps are read-only MappingProxyType views; pandas accepts any Mapping in df.rename().
 #
 # ----------------------------------------------------------------------------------------------------
 # Author:        Gerry Pidgeon
@@ -29,25 +30,14 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
-
-
-# ====================================================================================================
-# 2. PROJECT IMPORTS
-# ----------------------------------------------------------------------------------------------------
-# Bring in standard libraries and settings from the central import hub.
-# ====================================================================================================
-from processes.P00_set_packages import *
+from types import MappingProxyType
 
 
 # ====================================================================================================
-# 3. STATIC COLUMN RENAME MAPS
+# 2. STATIC COLUMN RENAME MAPS
 # ----------------------------------------------------------------------------------------------------
 # Provides consistent naming conventions between Just Eat exports and DWH data.
 # ====================================================================================================
@@ -55,7 +45,8 @@ from processes.P00_set_packages import *
 # ----------------------------------------------------------------------------------------------------
 # Just Eat Column Rename Map
 # ----------------------------------------------------------------------------------------------------
-JET_COLUMN_RENAME_MAP = {
+# Full list of parser output columns; identity entries document the schema but are filtered out below.
+_RAW_JET = {
     "order_id": "je_order_id",
     "date": "je_date",
     "total_incl_vat": "je_total",
@@ -67,11 +58,13 @@ JET_COLUMN_RENAME_MAP = {
     "statement_end": "statement_end",
     "payment_date": "payment_date",
 }
+JET_COLUMN_RENAME_MAP = MappingProxyType({k: v for k, v in _RAW_JET.items() if k != v})
 
 # ----------------------------------------------------------------------------------------------------
 # DWH Column Rename Map
 # ----------------------------------------------------------------------------------------------------
-DWH_COLUMN_RENAME_MAP = {
+# Full list of DWH export columns; only genuine renames are kept for df.rename().
+_RAW_DWH = {
     "id_obfuscated": "gp_order_id_obfuscated",
     "order_id": "gp_order_id",
     "partner_customer_order_number": "je_order_id",
@@ -99,3 +92,4 @@ DWH_COLUMN_RENAME_MAP = {
     "subtotal_exc_tips_local": "subtotal_exc_tips_local",
     "tips_local": "tips_local",
 }
+DWH_COLUMN_RENAME_MAP = MappingProxyType({k: v for k, v in _RAW_DWH.items() if k != v})
@@ -13,6 +13,7 @@
 #   • Automatically defaults accounting period to the previous month.
 #   • Scans existing JE Order Level Detail CSVs on startup to detect the latest statement coverage.
 #   • Auto-syncs statement period whenever accounting dates change.
+#   • Watches the output folder for new/removed CSVs when the optional `watchdog` package is installed.
 #   • Displays live status updates, progress indicators, and completion messages.
 #
 # Usage:
@@ -28,14 +29,10 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path and bytecode settings are applied once by the entry point (main/M00_run_gui.py).
 # ====================================================================================================
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
-
 
 # ====================================================================================================
 # 2. PROJECT IMPORTS
@@ -43,17 +40,151 @@ sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being create
 # All dependencies come from P00_set_packages.py.
 # NEVER import external packages directly in this file.
 # ====================================================================================================
-from processes.P00_set_packages import * # includes datetime as dt, tkinter as tk, ttk, messagebox, etc.
+from processes.P00_set_packages import (
+    tk, ttk, tkfont, messagebox, dt, re, os, fnmatch, subprocess, logging, queue,
+)
 from processes.P01_set_file_paths import root_folder, provider_output_folder
 from processes.P02_system_processes import detect_os # <-- ADDED IMPORT
 
+# Sync diagnostics run on every accounting-date edit, so they are logged at DEBUG rather than printed
+log = logging.getLogger("je_recon.gui")
+
 
 # ====================================================================================================
-# 3. MAIN GUI CLASS DEFINITION
+# 3. MODULE CONSTANTS AND COVERAGE HELPERS
 # ----------------------------------------------------------------------------------------------------
-# Provides the core Tkinter window and interactive workflow logic.
+# Widget options plus the Order Level Detail filename parsing / folder scanning used by the GUI's
+# statement coverage detection (ordered so each helper follows the ones it depends on).
 # ====================================================================================================
 
+# Shared construction options for every DateEntry (orange calendar popup, ISO date display)
+_DATE_ENTRY_OPTS = {
+    "width": 12,
+    "background": "#FF6600",
+    "foreground": "white",
+    "borderwidth": 2,
+    "date_pattern": "yyyy-MM-dd",
+}
+
+# How often the Tk thread drains queued watchdog events (ms)
+_COVERAGE_POLL_MS = 500
+
+# Offset back to the week's Monday, indexed by date.weekday()
+_MONDAY_OFFSETS = tuple(dt.timedelta(days=i) for i in range(7))
+
+# Matches "YY.MM.DD - YY.MM.DD - JE Order Level Detail.csv" → (sYY, sMM, sDD, eYY, eMM, eDD)
+_STMT_NAME_RE = re.compile(
+    r"(\d{2})\.(\d{2})\.(\d{2})\s*-\s*(\d{2})\.(\d{2})\.(\d{2})\s*-\s*JE Order Level Detail\.csv$",
+    re.I,
+)
+
+# Standard names are "YY.MM.DD - YY.MM.DD" (19 chars) followed by this suffix
+_STMT_NAME_SUFFIX = " - JE Order Level Detail.csv"
+_STMT_NAME_LEN = 19 + len(_STMT_NAME_SUFFIX)
+
+
+def _parse_coverage_name(name):
+    """
+    Parse the statement start/end dates from a JE Order Level Detail CSV filename.
+
+    Args:
+        name (str): Filename such as "25.06.02 - 25.06.08 - JE Order Level Detail.csv".
+
+    Returns:
+        tuple[date, date] | None: (start, end), or None if the name is not an Order Level Detail CSV
+        or holds an impossible date (e.g. "25.02.30").
+    """
+    # Fast path: fixed-width standard names are sliced directly
+    if len(name) == _STMT_NAME_LEN and name.endswith(_STMT_NAME_SUFFIX) and name[8:11] == " - ":
+        digits = name[0:2] + name[3:5] + name[6:8] + name[11:13] + name[14:16] + name[17:19]
+        if digits.isdecimal() and name[2] == name[5] == name[13] == name[16] == ".":
+            try:
+                return (
+                    dt.date(2000 + int(name[0:2]), int(name[3:5]), int(name[6:8])),
+                    dt.date(2000 + int(name[11:13]), int(name[14:16]), int(name[17:19])),
+                )
+            except ValueError:
+                return None
+
+    # Fallback: irregular spacing, casing or a leading prefix
+    if not fnmatch.fnmatch(name, "*JE Order Level Detail*.csv"):
+        return None
+    m = _STMT_NAME_RE.search(name)
+    if not m:
+        return None
+    sYY, sMM, sDD, eYY, eMM, eDD = m.groups()
+    try:
+        return (
+            dt.date(2000 + int(sYY), int(sMM), int(sDD)),
+            dt.date(2000 + int(eYY), int(eMM), int(eDD)),
+        )
+    except ValueError:
+        return None
+
+
+def _scan_coverage_files(folder):
+    """
+    Parse every JE Order Level Detail CSV in a folder.
+
+    Args:
+        folder (Path): Folder to scan (non-recursive).
+
+    Returns:
+        dict[str, tuple[date, date]]: Filename → (statement start, statement end).
+    """
+    found = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            parsed = _parse_coverage_name(entry.name)
+            if parsed is not None and entry.is_file(follow_symlinks=False):
+                found[entry.name] = parsed
+    return found
+
+
+def _coverage_range(ranges):
+    """Return (earliest start, latest end) across (start, end) pairs, or (None, None) if empty."""
+    earliest_start, latest_end = None, None
+    for s, e in ranges:
+        if earliest_start is None or s < earliest_start:
+            earliest_start = s
+        if latest_end is None or e > latest_end:
+            latest_end = e
+    return earliest_start, latest_end
+
+
+class _CoverageWatchHandler:
+    """
+    Minimal watchdog event handler that forwards Order Level Detail CSV changes to the GUI.
+
+    Watchdog only requires a `dispatch(event)` method, so this avoids importing its base class
+    when the optional dependency is missing. Events arrive on the observer thread, so they are only
+    queued here; the GUI drains the queue from the Tk thread (Tk is not thread-safe).
+    """
+
+    def __init__(self, events):
+        self.events = events
+
+    def dispatch(self, event):
+        if event.is_directory:
+            return
+        removed, added = None, None
+        if event.event_type in ("created", "modified"):
+            added = os.path.basename(event.src_path)
+        elif event.event_type == "deleted":
+            removed = os.path.basename(event.src_path)
+        elif event.event_type == "moved":
+            removed = os.path.basename(event.src_path)
+            added = os.path.basename(event.dest_path)
+        else:
+            return
+        self.events.put((removed, added))
+
+
+# ====================================================================================================
+# 4. MAIN GUI CLASS DEFINITION
+# ----------------------------------------------------------------------------------------------------
+# Provides the core Tkinter window and interactive workflow logic.
+# ====================================================================================================
 class JustEatReconciliationGUI(tk.Tk):
     """
     Main GUI window for the Just Eat Orders-to-Cash Reconciliation process.
@@ -69,6 +200,7 @@ class JustEatReconciliationGUI(tk.Tk):
         combine_dwh_callback (callable | None): Linked function for Step 1.
         process_pdfs_callback (callable | None): Linked function for Step 2.
         run_reconciliation_callback (callable | None): Linked function for Step 3.
+        stmt_auto_end (date | None): Auto-calculated statement end date from the last sync.
     """
 
     # ------------------------------------------------------------------------------------------------
@@ -78,6 +210,9 @@ class JustEatReconciliationGUI(tk.Tk):
         """Initialises the GUI window, default periods, and layout."""
         super().__init__()
 
+        # Keep the window hidden while widgets are built so Tk lays it out once, then shows it
+        self.withdraw()
+
         # Default accounting period = previous month (1st → last day)
         today = dt.date.today()
         first_of_this_month = today.replace(day=1)
@@ -92,37 +227,86 @@ class JustEatReconciliationGUI(tk.Tk):
         self.geometry("720x800")
         self.resizable(False, False)
         self.configure(bg="#f4f4f4")
+        # Fonts are created once and shared by every widget that uses them
+        self._f_title = tkfont.Font(self, family="Segoe UI", size=16, weight="bold")
+        self._f_body = tkfont.Font(self, family="Segoe UI", size=10)
+        self._f_small = tkfont.Font(self, family="Segoe UI", size=9)
+        self._f_hint = tkfont.Font(self, family="Segoe UI", size=9, slant="italic")
+        self._configure_styles()
 
         # External callbacks (wired by M00_run_gui.py)
         self.combine_dwh_callback = None
         self.process_pdfs_callback = None
         self.run_reconciliation_callback = None
 
+        # Auto-calculated statement end (Sunday after the last statement Monday), set by sync_statement_period
+        self.stmt_auto_end = None
+
+        # Pending Tk `after` id for the debounced statement-period sync
+        self._sync_after_id = None
+
+        # True while sync_statement_period is writing to widgets (blocks re-entrant syncs)
+        self._syncing = False
+
+        # Cached Order Level Detail coverage, keyed on the output folder's mtime: (mtime_ns, start, end)
+        self._coverage_cache = (None, None, None)
+
+        # Live coverage maintained by a watchdog observer when available. The observer thread only
+        # queues (removed, added) filenames; _poll_coverage_events applies them on the Tk thread.
+        self._coverage_files = {}
+        self._coverage_range = (None, None)
+        self._coverage_events = queue.SimpleQueue()
+        self._coverage_poll_id = None
+        self._observer = None
+
+        # Resolve the OS once and pick the matching "open folder" handler (None if unsupported)
+        self._os_type = detect_os()
+        self._open_handler = {
+            "Windows": lambda p: os.startfile(p),
+            "macOS": lambda p: subprocess.Popen(["open", str(p)], close_fds=True),
+            "Linux": lambda p: subprocess.Popen(["xdg-open", str(p)], close_fds=True),
+            "Windows (WSL)": lambda p: subprocess.Popen(["xdg-open", str(p)], close_fds=True),
+        }.get(self._os_type)
+
         # Build UI and event bindings
         self.build_ui()
         self.wire_accounting_change_events()
+        self._start_coverage_watch()
+        self.update_idletasks()
+        self.deiconify()
 
-        # Initial sync of statement period after GUI load
-        self.after(100, self.sync_statement_period)
+        # Initial sync of statement period (widgets already exist, so no need to wait for the event loop)
+        self.sync_statement_period()
 
 
     # ====================================================================================================
-    # 4. BUILD USER INTERFACE
+    # 5. BUILD USER INTERFACE
     # ----------------------------------------------------------------------------------------------------
     # Creates all visible UI components: headers, date pickers, buttons, progress indicators.
     # ====================================================================================================
     def build_ui(self):
         """Builds and lays out all GUI widgets, including headers, date selectors, and buttons."""
-        # --- Header ---
-        tk.Label(
-            self, text="🍴 Just Eat Reconciliation Tool",
-            font=("Segoe UI", 16, "bold"), bg="#f4f4f4", fg="#FF6600"
-        ).pack(pady=(15, 5))
-
-        tk.Label(
-            self, text=f"Root Folder: {root_folder}",
-            font=("Segoe UI", 9), bg="#f4f4f4", fg="#444"
-        ).pack(pady=(0, 10))
+        self._build_header()
+        self._build_accounting_period()
+        self._build_step1()
+        self._build_step2()
+        self._build_step3()
+        self._build_status()
+
+    def _configure_styles(self):
+        """Register the named ttk styles used by the labels in build_ui (configured once per window)."""
+        style = ttk.Style(self)
+        bg = "#f4f4f4"
+        style.configure("JE.TLabel", background=bg)
+        style.configure("JE.Title.TLabel", background=bg, foreground="#FF6600", font=self._f_title)
+        style.configure("JE.Path.TLabel", background=bg, foreground="#444", font=self._f_small)
+        style.configure("JE.Hint.TLabel", background=bg, foreground="#666", font=self._f_hint)
+
+    def _build_header(self):
+        """Title, root folder and the "How it works" instructions."""
+        ttk.Label(self, text="🍴 Just Eat Reconciliation Tool", style="JE.Title.TLabel").pack(pady=(15, 5))
+
+        ttk.Label(self, text=f"Root Folder: {root_folder}", style="JE.Path.TLabel").pack(pady=(0, 10))
 
         # --- Instructions ---
         instr_text = (
@@ -137,44 +321,39 @@ class JustEatReconciliationGUI(tk.Tk):
         instr_frame.pack(fill="x", padx=20, pady=(0, 10))
         tk.Label(
             instr_frame, text=instr_text, justify="left",
-            bg="#fff3e6", fg="#333", font=("Segoe UI", 10),
+            bg="#fff3e6", fg="#333", font=self._f_body,
             anchor="w", padx=10, pady=10
         ).pack(fill="x")
 
-        # -------------------------------------------------------------------------------------------
-        # ACCOUNTING PERIOD SELECTION
-        # -------------------------------------------------------------------------------------------
+    def _build_accounting_period(self):
+        """Accounting period DateEntry pair."""
+        # tkcalendar is only loaded once the window is actually built
+        from processes.P00_set_packages import DateEntry
+
         frame_acc = ttk.LabelFrame(self, text="Accounting Period (What goes in the books)")
         frame_acc.pack(fill="x", padx=20, pady=10)
         acc_frame = tk.Frame(frame_acc)
         acc_frame.pack(pady=5, fill="x")
 
         ttk.Label(acc_frame, text="Accounting Start:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-        self.acc_start_entry = DateEntry(
-            acc_frame, width=12, background="#FF6600", foreground="white",
-            borderwidth=2, date_pattern="yyyy-MM-dd"
-        )
+        self.acc_start_entry = DateEntry(acc_frame, **_DATE_ENTRY_OPTS)
         self.acc_start_entry.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(acc_frame, text="Accounting End:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
-        self.acc_end_entry = DateEntry(
-            acc_frame, width=12, background="#FF6600", foreground="white",
-            borderwidth=2, date_pattern="yyyy-MM-dd"
-        )
+        self.acc_end_entry = DateEntry(acc_frame, **_DATE_ENTRY_OPTS)
         self.acc_end_entry.grid(row=0, column=3, padx=5, pady=5)
 
         self.acc_start_entry.set_date(self.default_acc_start)
         self.acc_end_entry.set_date(self.default_acc_end)
 
-        tk.Label(
+        ttk.Label(
             frame_acc,
             text="Tip: Pick your reporting month here. JE covers up to latest statement; DWH accrues rest.",
-            bg="#f4f4f4", anchor="w", wraplength=640, justify="left"
+            style="JE.TLabel", anchor="w", wraplength=640, justify="left"
         ).pack(fill="x", padx=10, pady=(0, 5))
 
-        # -------------------------------------------------------------------------------------------
-        # STEP 1 — Combine DWH Data
-        # -------------------------------------------------------------------------------------------
+    def _build_step1(self):
+        """STEP 1 — Combine DWH Data."""
         frame_dwh = ttk.LabelFrame(self, text="Step 1 – Combine DWH Data")
         frame_dwh.pack(fill="x", padx=20, pady=10)
         ttk.Label(
@@ -183,31 +362,27 @@ class JustEatReconciliationGUI(tk.Tk):
         ).pack(anchor="w", padx=10, pady=5)
         ttk.Button(frame_dwh, text="Combine DWH Data", command=self.combine_dwh).pack(pady=(0, 5))
 
-        # -------------------------------------------------------------------------------------------
-        # STEP 2 — Process PDFs
-        # -------------------------------------------------------------------------------------------
+    def _build_step2(self):
+        """STEP 2 — Process PDFs (statement DateEntry pair, auto-calculated end and the run button)."""
+        from processes.P00_set_packages import DateEntry
+
         frame_pdf = ttk.LabelFrame(self, text="Step 2 – Process PDFs (Statement Period)")
         frame_pdf.pack(fill="x", padx=20, pady=10)
         date_frame = tk.Frame(frame_pdf)
         date_frame.pack(pady=5)
 
         ttk.Label(date_frame, text="Statement Start:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-        self.start_date_entry = DateEntry(
-            date_frame, width=12, background="#FF6600", foreground="white",
-            borderwidth=2, date_pattern="yyyy-MM-dd"
-        )
+        self.start_date_entry = DateEntry(date_frame, **_DATE_ENTRY_OPTS)
         self.start_date_entry.grid(row=0, column=1, padx=5, pady=5)
 
         ttk.Label(date_frame, text="Statement End:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
-        self.end_date_entry = DateEntry(
-            date_frame, width=12, background="#FF6600", foreground="white",
-            borderwidth=2, date_pattern="yyyy-MM-dd"
-        )
+        self.end_date_entry = DateEntry(date_frame, **_DATE_ENTRY_OPTS)
         self.end_date_entry.grid(row=0, column=3, padx=5, pady=5)
 
-        self.statement_end_label = tk.Label(
-            frame_pdf, text="Detected Statement End: (auto-calculated)",
-            bg="#f4f4f4", anchor="w", fg="#666", font=("Segoe UI", 9, "italic")
+        self._stmt_end_var = tk.StringVar(self, value="Detected Statement End: (auto-calculated)")
+        self.statement_end_label = ttk.Label(
+            frame_pdf, textvariable=self._stmt_end_var,
+            style="JE.Hint.TLabel", anchor="w"
         )
         self.statement_end_label.pack(fill="x", padx=10, pady=(0, 5))
 
@@ -216,9 +391,8 @@ class JustEatReconciliationGUI(tk.Tk):
             command=self.process_pdfs
         ).pack(pady=(5, 5))
 
-        # -------------------------------------------------------------------------------------------
-        # STEP 3 — Run Reconciliation
-        # -------------------------------------------------------------------------------------------
+    def _build_step3(self):
+        """STEP 3 — Run Reconciliation."""
         frame_recon = ttk.LabelFrame(self, text="Step 3 – Run Reconciliation")
         frame_recon.pack(fill="x", padx=20, pady=10)
         ttk.Label(
@@ -227,9 +401,8 @@ class JustEatReconciliationGUI(tk.Tk):
         ).pack(anchor="w", padx=10, pady=5)
         ttk.Button(frame_recon, text="Run Reconciliation", command=self.run_reconciliation).pack(pady=(5, 8))
 
-        # -------------------------------------------------------------------------------------------
-        # STATUS + PROGRESS BAR
-        # -------------------------------------------------------------------------------------------
+    def _build_status(self):
+        """Status line, progress bar and "Open Output Folder" button."""
         ttk.Separator(self).pack(fill="x", pady=(10, 5))
         self.status_label = ttk.Label(self, text="Status: Waiting for user input...", anchor="w")
         self.status_label.pack(fill="x", padx=20)
@@ -239,89 +412,181 @@ class JustEatReconciliationGUI(tk.Tk):
 
 
     # ====================================================================================================
-    # 5. ACCOUNTING ↔ STATEMENT AUTO-SYNC
+    # 6. ACCOUNTING ↔ STATEMENT AUTO-SYNC
     # ----------------------------------------------------------------------------------------------------
     # Keeps statement period aligned automatically with accounting date selection.
     # ====================================================================================================
 
     def wire_accounting_change_events(self):
-        """Attach bindings to trigger re-sync when accounting dates are modified."""
+        """Attach bindings to trigger re-sync when accounting dates are committed (picked, Enter, or focus out)."""
         for w in (self.acc_start_entry, self.acc_end_entry):
             w.bind("<<DateEntrySelected>>", self.on_accounting_changed, add="+")
             w.bind("<FocusOut>", self.on_accounting_changed, add="+")
-            w.bind("<KeyRelease>", self.on_accounting_changed, add="+")
+            w.bind("<Return>", self.on_accounting_changed, add="+")
 
     def on_accounting_changed(self, *_):
-        """Triggered whenever the accounting period is updated."""
+        """Triggered whenever the accounting period is updated; debounced so bursts of events sync once."""
+        if self._syncing:
+            return  # Event raised by our own programmatic update
+        if self._sync_after_id:
+            self.after_cancel(self._sync_after_id)
+        self._sync_after_id = self.after(250, self._do_sync)
+
+    def _do_sync(self):
+        """Run the debounced sync once the accounting dates have stopped changing."""
+        self._sync_after_id = None
         self.sync_statement_period()
 
     def sync_statement_period(self):
         """Automatically detect and align the statement period based on accounting dates."""
-        try:
-            acc_start_str, acc_end_str = self.get_accounting_period()
-            if not acc_start_str or not acc_end_str:
-                return
-
-            acc_start = dt.datetime.strptime(acc_start_str, "%Y-%m-%d").date()
-            acc_end = dt.datetime.strptime(acc_end_str, "%Y-%m-%d").date()
+        if self._syncing:
+            return
+        acc_start_str, acc_end_str = self.get_accounting_period()
+        if not acc_start_str or not acc_end_str:
+            return
 
-            stat_start_det, stat_end_det = self.detect_statement_coverage()
-            acc_start_monday, acc_end_monday = self.to_monday(acc_start), self.to_monday(acc_end)
+        # Incomplete or invalid dates are simply ignored until the user commits a valid value
+        try:
+            acc_start = dt.date.fromisoformat(acc_start_str)
+            acc_end = dt.date.fromisoformat(acc_end_str)
+        except ValueError:
+            log.debug("Ignoring invalid accounting period: %r → %r", acc_start_str, acc_end_str)
+            return
 
-            if not stat_end_det:
-                stat_start, stat_end = acc_start_monday, acc_end_monday
-            else:
-                stat_end = min(stat_end_det, acc_end_monday)
-                stat_start = acc_start_monday
+        stat_start_det, stat_end_det = self.detect_statement_coverage()
+        acc_start_monday = acc_start - _MONDAY_OFFSETS[acc_start.weekday()]
+        acc_end_monday = acc_end - _MONDAY_OFFSETS[acc_end.weekday()]
 
-            self.start_date_entry.set_date(stat_start.strftime("%Y-%m-%d"))
-            self.end_date_entry.set_date(stat_end.strftime("%Y-%m-%d"))
+        if not stat_end_det:
+            stat_start, stat_end = acc_start_monday, acc_end_monday
+        else:
+            stat_end = min(stat_end_det, acc_end_monday)
+            stat_start = acc_start_monday
 
-            stmt_auto_end = stat_end + dt.timedelta(days=6)
-            self.statement_end_label.config(
-                text=f"Detected Statement End: {stmt_auto_end.strftime('%Y-%m-%d')} (auto-calculated)"
-            )
+        stmt_auto_end = stat_end + dt.timedelta(days=6)
+        self.stmt_auto_end = stmt_auto_end
 
-        except Exception as e:
-            print(f"⚠ Error syncing statement period: {e}")
+        # Apply all widget updates in one guarded block so any events they raise are ignored
+        self._syncing = True
+        try:
+            self.start_date_entry.set_date(stat_start.isoformat())
+            self.end_date_entry.set_date(stat_end.isoformat())
+            end_text = f"Detected Statement End: {stmt_auto_end.isoformat()} (auto-calculated)"
+            if end_text != self._stmt_end_var.get():
+                self._stmt_end_var.set(end_text)
+        finally:
+            self._syncing = False
 
 
     # ====================================================================================================
-    # 6. HELPER METHODS
+    # 7. HELPER METHODS
     # ----------------------------------------------------------------------------------------------------
     # Utility functions for date conversion, detection, and input retrieval.
     # ====================================================================================================
     def to_monday(self, d):
         """Return the Monday of the given date's week."""
-        return d - dt.timedelta(days=d.weekday())
+        return d - _MONDAY_OFFSETS[d.weekday()]
 
     def detect_statement_coverage(self):
         """Detect earliest and latest JE Order Level Detail CSV statement coverage."""
+        # Watched folder: coverage is kept up to date by filesystem events
+        if self._observer is not None:
+            return self._coverage_range
+
         try:
-            pat = re.compile(
-                r"(?P<sYY>\d{2})\.(?P<sMM>\d{2})\.(?P<sDD>\d{2})\s*-\s*"
-                r"(?P<eYY>\d{2})\.(?P<eMM>\d{2})\.(?P<eDD>\d{2})\s*-\s*JE Order Level Detail\.csv$",
-                re.I,
-            )
-            earliest_start, latest_end = None, None
-            for p in provider_output_folder.glob("*JE Order Level Detail*.csv"):
-                m = pat.search(p.name)
-                if not m:
-                    continue
-                s = dt.date(int("20" + m["sYY"]), int(m["sMM"]), int(m["sDD"]))
-                e = dt.date(int("20" + m["eYY"]), int(m["eMM"]), int(m["eDD"]))
-                if earliest_start is None or s < earliest_start:
-                    earliest_start = s
-                if latest_end is None or e > latest_end:
-                    latest_end = e
+            # Adding/removing/renaming a CSV bumps the folder mtime, so an unchanged mtime means unchanged coverage
+            mtime = provider_output_folder.stat().st_mtime_ns
+            cached_mtime, cached_start, cached_end = self._coverage_cache
+            if mtime == cached_mtime:
+                return cached_start, cached_end
+
+            earliest_start, latest_end = _coverage_range(_scan_coverage_files(provider_output_folder).values())
+
+            self._coverage_cache = (mtime, earliest_start, latest_end)
             return earliest_start, latest_end
-        except Exception as e:
-            print(f"⚠ Error detecting statement coverage: {e}")
+        except Exception:
+            log.debug("Error detecting statement coverage", exc_info=True)
             return None, None
 
+    def _start_coverage_watch(self):
+        """Seed coverage from one folder scan and keep it current via watchdog (if installed)."""
+        from processes.P00_set_packages import Observer  # Lazy: watchdog is optional and GUI-only
+
+        if Observer is None:
+            return
+        try:
+            files = _scan_coverage_files(provider_output_folder)
+            self._coverage_files = files
+            self._coverage_range = _coverage_range(files.values())
+
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(
+                _CoverageWatchHandler(self._coverage_events), str(provider_output_folder), recursive=False
+            )
+            observer.start()
+            self._observer = observer
+            self._coverage_poll_id = self.after(_COVERAGE_POLL_MS, self._poll_coverage_events)
+        except Exception:
+            log.debug("Folder watch unavailable; using on-demand coverage scans", exc_info=True)
+
+    def _poll_coverage_events(self):
+        """Apply file events queued by the watchdog thread, then re-sync once if coverage changed (Tk thread)."""
+        changed = False
+        try:
+            while True:
+                try:
+                    removed, added = self._coverage_events.get_nowait()
+                except queue.Empty:
+                    break
+                changed |= self._apply_coverage_change(removed, added)
+            if changed:
+                self.on_accounting_changed()  # Debounced, so a burst of file events syncs once
+        finally:
+            # Always reschedule, so one bad event cannot stop coverage polling for the session
+            self._coverage_poll_id = self.after(_COVERAGE_POLL_MS, self._poll_coverage_events)
+
+    def _apply_coverage_change(self, removed, added):
+        """
+        Update live coverage for a renamed/added/removed file.
+
+        Args:
+            removed (str | None): Filename no longer present.
+            added (str | None): Filename created or renamed into the folder.
+
+        Returns:
+            bool: True if an Order Level Detail CSV was involved (coverage may have changed).
+        """
+        parsed = _parse_coverage_name(added) if added else None
+        old = self._coverage_files.pop(removed, None) if removed else None
+        if parsed is not None:
+            self._coverage_files[added] = parsed
+        if old is None and parsed is None:
+            return False  # Not an Order Level Detail CSV
+
+        earliest, latest = self._coverage_range
+        if old is not None and (old[0] == earliest or old[1] == latest):
+            # A boundary file went away: recompute from the remaining files
+            earliest, latest = _coverage_range(self._coverage_files.values())
+        elif parsed is not None:
+            earliest = parsed[0] if earliest is None else min(earliest, parsed[0])
+            latest = parsed[1] if latest is None else max(latest, parsed[1])
+        self._coverage_range = (earliest, latest)
+        return True
+
+    def destroy(self):
+        """Stop the folder watcher (if running) before tearing down the window."""
+        if self._coverage_poll_id is not None:
+            self.after_cancel(self._coverage_poll_id)
+            self._coverage_poll_id = None
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        super().destroy()
+
 
     # ====================================================================================================
-    # 7. BUTTON ACTIONS
+    # 8. BUTTON ACTIONS
     # ----------------------------------------------------------------------------------------------------
     # Triggered when GUI buttons are pressed (linked via M00_run_gui.py callbacks).
     # ====================================================================================================
@@ -338,8 +603,7 @@ class JustEatReconciliationGUI(tk.Tk):
         """Return all relevant date values as a dictionary."""
         acc_start, acc_end = self.get_accounting_period()
         stmt_start, stmt_end = self.get_statement_period()
-        m = re.search(r"(\d{4}-\d{2}-\d{2})", self.statement_end_label.cget("text"))
-        stmt_auto_end = m.group(1) if m else None
+        stmt_auto_end = self.stmt_auto_end.isoformat() if self.stmt_auto_end else None
         return {
             "acc_start": acc_start,
             "acc_end": acc_end,
@@ -358,7 +622,7 @@ class JustEatReconciliationGUI(tk.Tk):
     def process_pdfs(self):
         """Trigger Step 2 – Process PDFs."""
         if self.process_pdfs_callback:
-            s, e = self.start_date_entry.get(), self.end_date_entry.get()
+            s, e = self.get_statement_period()
             self.process_pdfs_callback(s, e)
         else:
             messagebox.showinfo("Info", "No function linked for Process PDFs button yet.")
@@ -381,19 +645,14 @@ class JustEatReconciliationGUI(tk.Tk):
 
     def open_folder_in_explorer(self, path_to_open: Path):
         """Cross-platform function to open a folder in the native file explorer."""
+        if self._open_handler is None:
+            messagebox.showerror("Error", f"Unsupported OS: {self._os_type}")
+            return
         try:
-            os_type = detect_os()
-            # Use os.startfile on Windows
-            if os_type == "Windows":
-                os.startfile(path_to_open)
-            # Use 'open' command on macOS
-            elif os_type == "macOS":
-                subprocess.run(["open", path_to_open], check=True)
-            # Use 'xdg-open' on Linux/WSL
-            elif os_type in ["Linux", "Windows (WSL)"]:
-                subprocess.run(["xdg-open", path_to_open], check=True)
-            else:
-                messagebox.showerror("Error", f"Unsupported OS: {os_type}")
+            # os.startfile on Windows; non-blocking 'open' / 'xdg-open' on macOS and Linux/WSL
+            self._open_handler(path_to_open)
+        except FileNotFoundError as e:
+            messagebox.showerror("Error", f"Could not find a program to open the folder:\n{e}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder:\n{e}")
 
@@ -15,6 +15,8 @@
 #
 # Usage:
 #   from processes.P07_module_configs import FILE_DATE_FORMAT, RECONCILIATION_TOLERANCE
+#   from processes.P07_module_configs import CONFIG        # CONFIG.FILE_DATE_FORMAT, ...
+#   from processes.P07_module_configs import skip_processed_pdfs   # env-overridable toggle: skip_processed_pdfs()
 #
 # Example:
 #   >>> print(FILE_DATE_FORMAT)
@@ -30,21 +32,31 @@
 # ====================================================================================================
 # 1. SYSTEM IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Add parent directory to sys.path so this module can import other "processes" packages.
+# sys.path is set by the entry-point script (e.g. main/M00_run_gui.py); bytecode writing is disabled
+# once for the whole package in processes/__init__.py.
 # ====================================================================================================
-import sys
+import os
 from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
+from functools import lru_cache
+from dataclasses import dataclass
 
 
 # ====================================================================================================
 # 2. PROJECT IMPORTS
 # ----------------------------------------------------------------------------------------------------
-# Bring in shared libraries and base settings from the central import hub.
+# This module only defines constants, so the central import hub is NOT imported eagerly.
+# Shared packages are still reachable as attributes (e.g. `P07_module_configs.pd`): they are resolved
+# from P00_set_packages on first access via a module-level __getattr__ (PEP 562).
 # ====================================================================================================
-from processes.P00_set_packages import *
+def __getattr__(name):
+    import importlib
+    hub = importlib.import_module("processes.P00_set_packages")
+    try:
+        value = getattr(hub, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    globals()[name] = value
+    return value
 
 
 # ====================================================================================================
@@ -52,52 +64,138 @@ from processes.P00_set_packages import *
 # ----------------------------------------------------------------------------------------------------
 # Shared constants for date formats, file naming, and reconciliation logic.
 # These should remain consistent across all provider workflows.
+#
+# Values live on one frozen, slotted dataclass instance (CONFIG) so they cannot be reassigned at
+# runtime and callers can hold a single reference (e.g. `from processes.P07_module_configs import CONFIG`).
 # ----------------------------------------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class _Config:
+    # --- Date & Time Formats ---
+    FILE_DATE_FORMAT: str = "%y.%m.%d"             # Format used in JE filenames (e.g., 25.06.23)
+    STANDARD_DATE_FORMAT: str = "%Y-%m-%d"         # Standard ISO format for output and logs
+    DISPLAY_DATE_FORMAT: str = "%d %b %Y"          # Human-readable display format for GUIs
+
+    # --- File Naming Conventions ---
+    JE_STATEMENT_KEYWORD: str = "JE Statement"
+    JE_ORDER_DETAIL_KEYWORD: str = "JE Order Level Detail"
+    OUTPUT_MASTER_FILENAME: str = "je_dwh_all.csv"
+
+    # --- Reconciliation Thresholds ---
+    RECONCILIATION_TOLERANCE: float = 0.01         # Max allowed float variance between JE and DWH totals
+    MATCH_STATUS_EXACT: str = "Matched"
+    MATCH_STATUS_VARIANCE: str = "Variance"
+    MATCH_STATUS_UNMATCHED: str = "Unmatched"
+
+    # --- Folder Naming ---
+    DWH_FOLDER_NAME: str = "03 DWH"
+    PDF_FOLDER_NAME: str = "02 PDFs"
+    OUTPUT_FOLDER_NAME: str = "04 Consolidated Output"
+
+    # --- Logging Settings ---
+    ENABLE_DEBUG_LOGGING: bool = False             # Toggle verbose console debug messages
+    LOG_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S" # Format for log timestamps
 
-# --- Date & Time Formats ---
-FILE_DATE_FORMAT = "%y.%m.%d"             # Format used in JE filenames (e.g., 25.06.23)
-STANDARD_DATE_FORMAT = "%Y-%m-%d"         # Standard ISO format for output and logs
-DISPLAY_DATE_FORMAT = "%d %b %Y"          # Human-readable display format for GUIs
+    # --- Functional Toggles (see Section 4) ---
+    AUTO_OPEN_OUTPUT_FOLDER: bool = True           # Automatically open output folder when reconciliation completes
+    SKIP_PROCESSED_PDFS: bool = True               # Skip previously processed PDFs to speed up reruns
+    CACHE_DIR: Path = Path(__file__).resolve().parent.parent / "cache"  # Extracted statement text cache (JSON per PDF fingerprint)
+    AUTO_CREATE_REFERENCE_FOLDERS: bool = True     # Automatically create missing reference folders if not found
 
-# --- File Naming Conventions ---
-JE_STATEMENT_KEYWORD = "JE Statement"
-JE_ORDER_DETAIL_KEYWORD = "JE Order Level Detail"
-OUTPUT_MASTER_FILENAME = "je_dwh_all.csv"
 
-# --- Reconciliation Thresholds ---
-RECONCILIATION_TOLERANCE = 0.01           # Max allowed float variance between JE and DWH totals
-MATCH_STATUS_EXACT = "Matched"
-MATCH_STATUS_VARIANCE = "Variance"
-MATCH_STATUS_UNMATCHED = "Unmatched"
+CONFIG = _Config()
 
-# --- Folder Naming ---
-DWH_FOLDER_NAME = "03 DWH"
-PDF_FOLDER_NAME = "02 PDFs"
-OUTPUT_FOLDER_NAME = "04 Consolidated Output"
+# --- Legacy module-level names (kept so existing `from ... import NAME` imports keep working) ---
+FILE_DATE_FORMAT = CONFIG.FILE_DATE_FORMAT
+STANDARD_DATE_FORMAT = CONFIG.STANDARD_DATE_FORMAT
+DISPLAY_DATE_FORMAT = CONFIG.DISPLAY_DATE_FORMAT
 
-# --- Logging Settings ---
-ENABLE_DEBUG_LOGGING = False               # Toggle verbose console debug messages
-LOG_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"  # Format for log timestamps
+JE_STATEMENT_KEYWORD = CONFIG.JE_STATEMENT_KEYWORD
+JE_ORDER_DETAIL_KEYWORD = CONFIG.JE_ORDER_DETAIL_KEYWORD
+OUTPUT_MASTER_FILENAME = CONFIG.OUTPUT_MASTER_FILENAME
+
+RECONCILIATION_TOLERANCE = CONFIG.RECONCILIATION_TOLERANCE
+MATCH_STATUS_EXACT = CONFIG.MATCH_STATUS_EXACT
+MATCH_STATUS_VARIANCE = CONFIG.MATCH_STATUS_VARIANCE
+MATCH_STATUS_UNMATCHED = CONFIG.MATCH_STATUS_UNMATCHED
+
+DWH_FOLDER_NAME = CONFIG.DWH_FOLDER_NAME
+PDF_FOLDER_NAME = CONFIG.PDF_FOLDER_NAME
+OUTPUT_FOLDER_NAME = CONFIG.OUTPUT_FOLDER_NAME
+
+ENABLE_DEBUG_LOGGING = CONFIG.ENABLE_DEBUG_LOGGING
+LOG_DATETIME_FORMAT = CONFIG.LOG_DATETIME_FORMAT
 
 
 # ====================================================================================================
 # 4. FUNCTIONAL CONFIGURATION TOGGLES
 # ----------------------------------------------------------------------------------------------------
-# Use these to enable/disable optional behaviours at runtime.
+# Use these to enable/disable optional behaviours at runtime (defaults are set on _Config above).
+# Code that should honour environment overrides calls the Section 5 accessors instead.
 # ----------------------------------------------------------------------------------------------------
+AUTO_OPEN_OUTPUT_FOLDER = CONFIG.AUTO_OPEN_OUTPUT_FOLDER
+SKIP_PROCESSED_PDFS = CONFIG.SKIP_PROCESSED_PDFS
+CACHE_DIR = CONFIG.CACHE_DIR
+AUTO_CREATE_REFERENCE_FOLDERS = CONFIG.AUTO_CREATE_REFERENCE_FOLDERS
+
+
+# ====================================================================================================
+# 5. ENVIRONMENT OVERRIDES (CACHED ACCESSORS)
+# ----------------------------------------------------------------------------------------------------
+# Runtime toggles that can be flipped per run without editing code or restarting a long-lived process:
+#   OTC_AUTO_OPEN_OUTPUT, OTC_SKIP_PDFS, OTC_DEBUG_LOGGING  →  "1/true/yes/on" or "0/false/no/off"
+# Unset or unrecognised values fall back to the CONFIG defaults above. Each accessor reads the
+# environment once and caches the result; call reset_config_cache() after changing os.environ.
+# ----------------------------------------------------------------------------------------------------
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _env_flag(var: str, default: bool) -> bool:
+    """
+    Read a boolean flag from the environment.
+
+    Args:
+        var (str): Environment variable name.
+        default (bool): Value used when the variable is unset or unrecognised.
+
+    Returns:
+        bool: Parsed flag value.
+    """
+    value = os.environ.get(var, "").strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    return default
+
+
+@lru_cache(maxsize=1)
+def auto_open_output_folder() -> bool:
+    """Return whether the output folder should be opened on completion (env: OTC_AUTO_OPEN_OUTPUT)."""
+    return _env_flag("OTC_AUTO_OPEN_OUTPUT", CONFIG.AUTO_OPEN_OUTPUT_FOLDER)
+
+
+@lru_cache(maxsize=1)
+def skip_processed_pdfs() -> bool:
+    """Return whether previously parsed PDFs may be served from the cache (env: OTC_SKIP_PDFS)."""
+    return _env_flag("OTC_SKIP_PDFS", CONFIG.SKIP_PROCESSED_PDFS)
+
 
-# Automatically open output folder when reconciliation completes
-AUTO_OPEN_OUTPUT_FOLDER = True
+@lru_cache(maxsize=1)
+def enable_debug_logging() -> bool:
+    """Return whether verbose debug logging is enabled (env: OTC_DEBUG_LOGGING)."""
+    return _env_flag("OTC_DEBUG_LOGGING", CONFIG.ENABLE_DEBUG_LOGGING)
 
-# Skip previously processed PDFs to speed up reruns
-SKIP_PROCESSED_PDFS = True
 
-# Automatically create missing reference folders if not found
-AUTO_CREATE_REFERENCE_FOLDERS = True
+def reset_config_cache() -> None:
+    """Forget cached environment reads so the next accessor call re-reads os.environ."""
+    auto_open_output_folder.cache_clear()
+    skip_processed_pdfs.cache_clear()
+    enable_debug_logging.cache_clear()
 
 
 # ====================================================================================================
-# 5. FUTURE EXTENSIONS
+# 6. FUTURE EXTENSIONS
 # ----------------------------------------------------------------------------------------------------
 # Add additional environment-specific configurations (e.g. test/staging vs production),
 # API tokens, or Snowflake connection parameters here if needed.
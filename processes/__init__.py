@@ -0,0 +1,12 @@
+# ====================================================================================================
+# processes/__init__.py
+# ----------------------------------------------------------------------------------------------------
+# Package initialiser for the shared "processes" modules.
+#
+# Purpose:
+#   - Disable __pycache__ creation once, before any processes.* submodule is compiled, instead of
+#     repeating the setting at the top of every module.
+# ====================================================================================================
+import sys
+
+sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
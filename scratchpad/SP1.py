@@ -5,7 +5,7 @@
 # ----------------------------------------------------------------------------------------------------
 # Purpose:
 #   - Reads all statement PDFs (e.g. "25.09.01 - JE Statement.pdf") for a selected date range.
-#   - Extracts detailed transaction data and creates a single, standardised CSV output.
+#   - Extracts detailed transaction data and creates a single, standardised CSV output (plus a Parquet copy).
 #   - Builds per-statement refund detail CSVs and a consolidated “Order Level Detail” file.
 #
 # Inputs:
@@ -14,11 +14,16 @@
 # Outputs:
 #   • One “RefundDetails.csv” per PDF processed
 #   • A consolidated "<yy.mm.dd> - <yy.mm.dd> - JE Order Level Detail.csv" in provider_output_folder
+#     (read by Step 3 / M03 and the GUI's coverage scan), plus the same data as a zstd ".parquet"
+#     copy; both are written with pyarrow when it is installed (pandas CSV writer otherwise)
 #
 # Notes:
 #   - Keeps all financial amounts positive; signs applied at refund aggregation stage.
 #   - Commission/Marketing totals are adjusted to include VAT (20% uplift).
 #   - Filename date is treated as start of statement week (Monday → Sunday).
+#   - Scratchpad only: the GUI runs main/M02_process_mp_data.run_je_parser. Of the speed-ups made
+#     here, only the per-PDF process pool has been ported to M02; the PDFium text, statement cache
+#     and fused regexes do not reach production until they are ported too.
 # ----------------------------------------------------------------------------------------------------
 # Author:        Gerry Pidgeon
 # Created:       2025-11-05
@@ -34,8 +39,10 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being created
+# Only needed when run as a plain script; package imports (`python -m`, or M00 importing M01–M03)
+# already have the project root on sys.path.
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 
 # ====================================================================================================
@@ -43,15 +50,19 @@ sys.dont_write_bytecode = True  # Prevents __pycache__ folders from being create
 # ----------------------------------------------------------------------------------------------------
 # Bring in shared functions, constants, and file paths.
 # ====================================================================================================
-from processes.P00_set_packages import *
+from processes.P00_set_packages import (
+    os, io, re, json, fnmatch, hashlib, contextlib, date, datetime, timedelta, pd, np, pdfium, ProcessPoolExecutor,
+)
+# pdfplumber / extract_text are only imported by the fallback paths that use them (see Section 4)
 from processes.P01_set_file_paths import (
     provider_pdf_folder,
     provider_pdf_unprocessed_folder,
     provider_output_folder,
     provider_refund_folder,
 )
-from processes.P03_shared_functions import statement_overlaps_file, get_je_statement_coverage
+from processes.P03_shared_functions import get_je_statement_coverage
 from processes.P04_static_lists import JET_COLUMN_RENAME_MAP
+from processes.P07_module_configs import skip_processed_pdfs, CACHE_DIR, JE_ORDER_DETAIL_KEYWORD
 
 
 # ====================================================================================================
@@ -63,6 +74,11 @@ PDF_FOLDER = provider_pdf_unprocessed_folder
 OUTPUT_FOLDER = provider_output_folder
 REFUND_FOLDER = provider_refund_folder
 
+# Read full statement text with PDFium (much faster than pdfplumber). The original pdfplumber pages and
+# pdfminer segment are used when this is off, when pypdfium2 is unavailable, or when PDFium's text does
+# not parse every order the statement header reports.
+USE_PDFIUM_TEXT = True
+
 
 # ====================================================================================================
 # 4. HELPER FUNCTIONS – PDF EXTRACTION AND CLEANING
@@ -70,91 +86,181 @@ REFUND_FOLDER = provider_refund_folder
 # Extract text, clean descriptions, parse monetary values, and build structured DataFrames.
 # ====================================================================================================
 
-def get_segment_text(pdf_path: Path) -> str:
+# --- Precompiled patterns (compiled once at import, reused for every PDF) ---
+_AMOUNT_RE = re.compile(r"([–\-]?)\s*£\s*([0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2})")    # (sign, amount) incl. en-dash sign
+_FILE_DATE_RE = re.compile(r"(\d{2})\.(\d{2})\.(\d{2})")                          # "yy.mm.dd" in statement filenames
+_WS_RE = re.compile(r"\s+")
+_WS2_RE = re.compile(r"\s{2,}")
+# --- Statement header / order line patterns (used per PDF in _parse_statement) ---
+_PERIOD_RES = (
+    re.compile(r"(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})\s*[-–to]+\s*(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I),
+    re.compile(r"(\d{1,2}/\d{1,2}/\d{2,4})\s*[-–to]+\s*(\d{1,2}/\d{1,2}/\d{2,4})", re.I),
+)
+_ORDERS_COUNT_RE = re.compile(r"Number\s+of\s+orders\s+([\d,]+)", re.I)
+_TOTAL_SALES_RE = re.compile(r"Total\s+sales.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
+_YOU_RECEIVE_RE = re.compile(r"You\s+will\s+receive.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
+_PAYMENT_DATE_RE = re.compile(r"paid\s+on\s+(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I)
+# The four header patterns above as one alternation, so a single scan labels every capture
+_HEADER_RE = re.compile(
+    r"(?:Number\s+of\s+orders\s+(?P<orders_n>[\d,]+))"
+    r"|(?:Total\s+sales.*?£\s*(?P<sales_n>[\d,]+\.\d{2}))"
+    r"|(?:You\s+will\s+receive.*?£\s*(?P<recv_n>[\d,]+\.\d{2}))"
+    r"|(?:paid\s+on\s+(?P<pay_d>\d{1,2}\s+[A-Za-z]{3,}\s+\d{4}))",
+    re.I | re.S,
+)
+_HEADER_FALLBACK_RES = {
+    "orders_n": _ORDERS_COUNT_RE,
+    "sales_n": _TOTAL_SALES_RE,
+    "recv_n": _YOU_RECEIVE_RE,
+    "pay_d": _PAYMENT_DATE_RE,
+}
+# Order line → (date, order_id, order_type, last "£" amount on the same line); greedy ".*" picks the last amount
+_ORDER_LINE_RE = re.compile(
+    r"^\s*\d+\s+(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([A-Za-z/&\-]+)\s+.*£[^\S\n]*([\d.,]+)", re.M
+)
+
+# Statement date formats, tried in this order within each family (see parse_date_safe)
+_NAMED_DATE_FORMATS = ("%d %b %Y", "%d %B %Y")
+_SLASH_DATE_FORMATS = ("%d/%m/%Y", "%d/%m/%y")
+
+# Column order shared by every per-statement row fragment (orders, refunds, commission/marketing)
+_ROW_COLUMNS = (
+    "order_id", "date", "order_type", "total_incl_vat", "refund_amount", "type",
+    "source_file", "statement_start", "statement_end", "payment_date",
+)
+
+# --- je_order_id clean-up (STEP 10) ---
+# One pass: a float-style ".0" suffix (plus any trailing whitespace) goes first, then every other non-digit
+_JE_ID_CLEAN_RE = re.compile(r"\.0\s*$|[^0-9]")
+
+# Bump when the segment extraction/parsing logic changes, so stale cached results are not reused
+_CACHE_VERSION = "6"
+
+_REASON_RE = re.compile(
+    r"(?:Customer compensation for (?P<r1>.*?) query (?P<o1>\d+))"
+    r"|(?:Restaurant\s+Comp\s*[-–]?\s*Cancelled\s+Order\s*[-–\s]*?(?P<o2>\d+))"
+    r"|(?:Order\s*ID[:\s]*(?P<o3>[0-9]+)\s*[-–]\s*Partner\s+Compensation\s+Recook)",
+    re.I,
+)
+
+
+def _iter_page_text(pdf_path: Path):
+    """
+    Yield the text of each page of a PDF in order, using PDFium.
+
+    Args:
+        pdf_path (Path): Full path to the PDF.
+
+    Yields:
+        str: Page text with line endings normalised to "\n".
+
+    Notes:
+        • The document is closed as soon as the caller stops iterating, so callers can short-circuit.
+    """
+    pdf = pdfium.PdfDocument(str(pdf_path))
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            yield text.replace("\r\n", "\n")
+    finally:
+        pdf.close()
+
+
+def get_segment_text(full_text: str) -> str:
     """
     Extract the section of a Just Eat PDF statement between
     “Commission to Just Eat” and “Subtotal”.
 
     Args:
-        pdf_path (Path): Full path to the Just Eat PDF statement.
+        full_text (str): Statement text already extracted by `_read_statement_text()`.
 
     Returns:
         str: Extracted text segment between the two markers.
              Returns an empty string if either marker is missing.
 
     Notes:
-        • Uses `pdfminer.six.extract_text()` for accurate text extraction.
+        • Works on text only, so the PDF is not opened again for the segment.
         • Gracefully handles missing markers to avoid breaking the pipeline.
         • Isolates Commission/Marketing/Refund area for later structured parsing.
     """
-    txt = extract_text(str(pdf_path))
-    start = txt.find("Commission to Just Eat")
-    end = txt.find("Subtotal", start)
-    return "" if start == -1 or end == -1 else txt[start:end]
+    start = full_text.find("Commission to Just Eat")
+    end = full_text.find("Subtotal", start)
+    return "" if start == -1 or end == -1 else full_text[start:end]
 
 
-def extract_descriptions(segment_text: str) -> list[str]:
+def extract_entries(segment_text: str) -> tuple[list[str], list[float]]:
     """
-    Clean and consolidate multi-line description entries found in the
-    Commission/Refund section of a statement.
+    Split a Commission/Refund text segment into description lines and £ amounts in a single pass.
 
     Args:
         segment_text (str): Raw text extracted between 'Commission to Just Eat' and 'Subtotal'.
 
     Returns:
-        list[str]: Cleaned description lines (merged multi-line entries, no extraneous symbols).
+        tuple[list[str], list[float]]: (descriptions, amounts)
+            • descriptions – Cleaned description lines (merged multi-line entries, £-amounts removed).
+            • amounts – Signed monetary values in the order they appear.
 
     Notes:
-        • Removes empty lines, isolated £-amount lines, and redundant whitespace.  
-        • Merges wrapped lines starting with lower-case letters (PDF word-wrap artefacts).  
-        • Provides consistent input for regex refund-reason parsing.
+        • One regex pass both collects each amount and removes it from the text; descriptions are
+          built from what is left, so the two lists come from the same scan.
+        • Handles en-dash / hyphen signs, thousands separators and signs split from the £ by a line break.
+        • Merges wrapped lines starting with lower-case letters (PDF word-wrap artefacts).
     """
     if not segment_text:
-        return []
-    lines = [re.sub(r"\s+", " ", ln).strip() for ln in segment_text.splitlines() if ln.strip()]
-    money_re = re.compile(r"[–\-]?\s*£\s*[0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2}")
-    lines = [money_re.sub("", ln).strip() for ln in lines if not money_re.fullmatch(ln)]
-    merged = []
-    for ln in lines:
-        if not merged:
-            merged.append(ln)
-        elif ln[0].isupper():
-            merged.append(ln)
+        return [], []
+
+    amounts = []
+
+    def _take_amount(m):
+        value = float(m.group(2).replace(",", ""))
+        amounts.append(-value if m.group(1) else value)
+        return "\n" * m.group(0).count("\n")  # Keep line structure for the description pass
+
+    residual = _AMOUNT_RE.sub(_take_amount, segment_text)
+
+    # Collect each entry's wrapped lines as fragments and join once, rather than re-copying a growing string
+    groups = []
+    for ln in residual.splitlines():
+        ln = _WS_RE.sub(" ", ln).strip()
+        if not ln:
+            continue
+        if groups and not ln[0].isupper():
+            groups[-1].append(ln)
         else:
-            merged[-1] += " " + ln
-    return [re.sub(r"\s{2,}", " ", s).strip() for s in merged if s]
+            groups.append([ln])
+    return [_WS2_RE.sub(" ", " ".join(g)).strip() for g in groups], amounts
+
+
+def extract_descriptions(segment_text: str) -> list[str]:
+    """
+    Clean and consolidate multi-line description entries found in the
+    Commission/Refund section of a statement.
+
+    Args:
+        segment_text (str): Raw text extracted between 'Commission to Just Eat' and 'Subtotal'.
+
+    Returns:
+        list[str]: Cleaned description lines (see `extract_entries()`).
+    """
+    return extract_entries(segment_text)[0]
 
 
 def extract_amounts(segment_text: str) -> list[float]:
     """
-    Extract all monetary (£) amounts from a text segment, handling
-    negative signs, en-dashes, and line-break irregularities.
+    Extract all monetary (£) amounts from a text segment.
 
     Args:
         segment_text (str): Raw text from the PDF section being processed.
 
     Returns:
-        list[float]: Numeric list of positive/negative monetary values.
-
-    Notes:
-        • Converts en-dashes (–) to standard hyphens.  
-        • Fixes split patterns (“- \n£12.34”).  
-        • Supports thousands separators and converts to float.
+        list[float]: Numeric list of positive/negative monetary values (see `extract_entries()`).
     """
-    if not segment_text:
-        return []
-    segment_text = (
-        segment_text.replace("–", "-")
-        .replace("- \n£", "-£")
-        .replace("-\n£", "-£")
-    )
-    results = []
-    pattern = re.compile(r"([\-]?)\s*£\s*([0-9]{1,3}(?:,[0-9]{3})*\.[0-9]{2})")
-    for m in pattern.finditer(segment_text):
-        sign = -1 if m.group(1) == "-" else 1
-        value = float(m.group(2).replace(",", "")) * sign
-        results.append(value)
-    return results
+    return extract_entries(segment_text)[1]
 
 
 def parse_reason_and_order(desc: str) -> tuple[str, str]:
@@ -177,17 +283,19 @@ def parse_reason_and_order(desc: str) -> tuple[str, str]:
             3️⃣ "Order ID: 123456 - Partner Compensation Recook"
         Returns ("", "") if no pattern matches.
     """
-    reason, order = "", ""
-    m1 = re.search(r"Customer compensation for (.*?) query (\d+)", desc, re.IGNORECASE)
-    if m1:
-        return m1.group(1).strip(), m1.group(2).strip()
-    m2 = re.search(r"Restaurant\s+Comp\s*[-–]?\s*Cancelled\s+Order\s*[-–\s]*?(\d+)", desc, re.IGNORECASE)
-    if m2:
-        return "Restaurant Comp - Cancelled Order", m2.group(1).strip()
-    m3 = re.search(r"Order\s*ID[:\s]*([0-9]+)\s*[-–]\s*Partner\s+Compensation\s+Recook", desc, re.IGNORECASE)
-    if m3:
-        return "Partner Compensation Recook", m3.group(1).strip()
-    return reason, order
+    # Every known format contains "comp" (Compensation / Comp), so most lines skip the regex entirely
+    if "comp" not in desc.lower():
+        return "", ""
+
+    # One scan over the line; the named group that matched identifies the format
+    m = _REASON_RE.search(desc)
+    if not m:
+        return "", ""
+    if m["o1"] is not None:
+        return m["r1"].strip(), m["o1"].strip()
+    if m["o2"] is not None:
+        return "Restaurant Comp - Cancelled Order", m["o2"].strip()
+    return "Partner Compensation Recook", m["o3"].strip()
 
 
 def build_dataframe(descriptions: list[str], amounts: list[float]) -> pd.DataFrame:
@@ -202,43 +310,460 @@ def build_dataframe(descriptions: list[str], amounts: list[float]) -> pd.DataFra
         pandas.DataFrame with columns:  
             • description (str)  
             • amount (float)  
-            • reason (str)  
+            • reason (category)  
             • order_number (str)  
             • outside_scope (bool)
 
     Notes:
         • Pairs items up to the shorter list length.  
-        • Flags “Outside the scope of VAT”.  
+        • Builds typed columns directly (no per-row dicts), so an empty input still has all columns.  
+        • Flags “Outside the scope of VAT” with one vectorised `.str.contains` pass.  
         • Forms the core refund and commission extraction table.
     """
     n = min(len(descriptions), len(amounts))
-    data = []
-    for i in range(n):
-        desc = descriptions[i]
-        amt = amounts[i]
-        reason, order = parse_reason_and_order(desc)
-        data.append({
-            "description": desc,
-            "amount": amt,
-            "reason": reason,
-            "order_number": order,
-            "outside_scope": "Outside the scope of VAT" in desc
-        })
-    return pd.DataFrame(data)
+    descs = descriptions[:n]
+
+    # Pre-sized columns: amounts go straight into one float64 buffer, text columns are filled by index
+    amt_arr = np.fromiter(amounts, dtype=np.float64, count=n)
+    reasons = [""] * n
+    orders = [""] * n
+    for i, desc in enumerate(descs):
+        reasons[i], orders[i] = parse_reason_and_order(desc)
+
+    df = pd.DataFrame({
+        "description": pd.Series(descs, dtype=str),  # Explicit so `.str` also works on an empty segment
+        "amount": amt_arr,
+        "reason": reasons,
+        "order_number": orders,
+    })
+    # One vectorised literal scan over the finished column rather than a check per row
+    df["outside_scope"] = df["description"].str.contains("Outside the scope of VAT", regex=False, na=False).astype(bool)
+    # Only a handful of distinct reasons repeat across rows → store one small code per row
+    df["reason"] = df["reason"].astype("category")
+    return df
+
+
+def parse_date_safe(date_str: str):
+    """
+    Safely parse a statement date ("2 Jun 2025", "02/06/2025", "02/06/25") to a date.
+
+    Args:
+        date_str (str): Raw date text from the PDF.
+
+    Returns:
+        datetime.date | None: Parsed date, or None if empty or unparseable.
+
+    Notes:
+        • A "/" check picks the slash or month-name format family up front, so at most two
+          strptime attempts are made instead of four.
+    """
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+    fmts = _SLASH_DATE_FORMATS if "/" in date_str else _NAMED_DATE_FORMATS
+    for fmt in fmts:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _scan_header_fields(full_text: str) -> dict:
+    """
+    Capture the statement header values used for validation in one pass over the text.
+
+    Args:
+        full_text (str): Full statement text.
+
+    Returns:
+        dict: {"orders_n", "sales_n", "recv_n", "pay_d"} → captured text, or None if not found.
+
+    Notes:
+        • The first match of each field wins and the scan stops once all four are found, so the
+          order-line body of the statement is usually never traversed.
+        • The branches start with distinct keywords, so the only way the combined scan can differ
+          from four independent searches is a field starting inside another match's span (the lazy
+          "Total sales … £" / "You will receive … £" branches). Those spans are re-checked with the
+          field's own pattern, and fields the scan misses entirely are searched individually.
+    """
+    found = dict.fromkeys(_HEADER_FALLBACK_RES)
+    first_at = {}
+    spans = []
+    for m in _HEADER_RE.finditer(full_text):
+        key = m.lastgroup
+        spans.append((m.start(), m.end(), key))
+        if found[key] is None:
+            found[key] = m.group(key)
+            first_at[key] = m.start()
+            if len(first_at) == len(found):
+                break
+
+    for key, pattern in _HEADER_FALLBACK_RES.items():
+        if found[key] is None:
+            m = pattern.search(full_text)
+            if m:
+                found[key] = m.group(1)
+            continue
+        for start, end, other in spans:
+            if other == key or start >= first_at[key]:
+                continue
+            m = pattern.search(full_text, start + 1)
+            if m and m.start() < end and m.start() < first_at[key]:
+                found[key], first_at[key] = m.group(1), m.start()
+    return found
+
+
+def _cache_stem(pdf_path: Path) -> str | None:
+    """
+    Build the cache file stem for a statement PDF from its file fingerprint.
+
+    Args:
+        pdf_path (Path): Full path to the Just Eat PDF statement.
+
+    Returns:
+        str | None: CACHE_DIR file stem, or None when caching is switched off (skip_processed_pdfs()).
+
+    Notes:
+        • Keyed by (resolved path, mtime_ns, size, _CACHE_VERSION) from one stat() call, so a cache hit
+          never reads the PDF itself. Replacing or re-saving a statement changes its mtime → cache miss.
+        • The text backend is part of the key (USE_PDFIUM_TEXT and whether pypdfium2 is installed), so
+          switching between PDFium and pdfplumber/pdfminer never serves the other backend's text.
+    """
+    if not skip_processed_pdfs():
+        return None
+    st = pdf_path.stat()
+    key = (
+        f"{pdf_path.resolve()}|{st.st_mtime_ns}|{st.st_size}|{_CACHE_VERSION}"
+        f"|pdfium_text={USE_PDFIUM_TEXT}|pdfium={pdfium is not None}"
+    )
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _read_statement_text(pdf_path: Path) -> tuple[list[str], str]:
+    """
+    Extract a statement's page text and its commission/refund segment (cached per file fingerprint).
+
+    Args:
+        pdf_path (Path): Full path to the Just Eat PDF statement.
+
+    Returns:
+        tuple[list[str], str]: One text string per page, and the `get_segment_text()` segment.
+
+    Notes:
+        • When skip_processed_pdfs() is on, both are cached as CACHE_DIR/<fingerprint>.json, so reruns
+          over unchanged statements skip the PDF entirely.  
+        • Caching is best-effort: an unreadable or unwritable cache just means the PDF is parsed again.
+    """
+    stem = _cache_stem(pdf_path)
+    cache_file = CACHE_DIR / f"{stem}.json" if stem else None
+    if cache_file is not None and cache_file.exists():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            return cached["pages"], cached["segment"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Unreadable → re-extract below
+
+    pages, segment = _extract_statement_text(pdf_path)
+
+    if cache_file is not None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({"pages": pages, "segment": segment}), encoding="utf-8")
+        except OSError:
+            pass
+    return pages, segment
+
+
+def _pdfium_text_usable(pages: list[str], text: str) -> bool:
+    """
+    Check that PDFium's text can stand in for pdfplumber's for the statement parser.
+
+    Args:
+        pages (list[str]): PDFium text per page.
+        text (str): The same pages joined with "\n".
+
+    Returns:
+        bool: True only if a statement period is found (as `_parse_statement()` looks for it) and the
+              number of order lines `_ORDER_LINE_RE` parses equals the header's "Number of orders".
+
+    Notes:
+        • A partial layout difference would otherwise drop some order lines silently, so anything
+          short of an exact count match (including a missing header count) falls back to pdfplumber.
+    """
+    if not any(pat.search(page_text) for page_text in pages for pat in _PERIOD_RES):
+        return False
+    m = _ORDERS_COUNT_RE.search(text)
+    if not m:
+        return False
+    parsed_orders = sum(1 for _ in _ORDER_LINE_RE.finditer(text))
+    return parsed_orders == int(m.group(1).replace(",", ""))
+
+
+def _extract_statement_text(pdf_path: Path) -> tuple[list[str], str]:
+    """
+    Extract a statement's page text and its commission/refund segment from the file itself.
+
+    Args:
+        pdf_path (Path): Full path to the Just Eat PDF statement.
+
+    Returns:
+        tuple[list[str], str]: One text string per page, and the `get_segment_text()` segment.
+
+    Notes:
+        • With USE_PDFIUM_TEXT on, the PDF is read once with PDFium and both the pages and the segment
+          come from that text, but only when `_pdfium_text_usable()` confirms the parser reads it
+          completely (PDFium emits content-stream order rather than pdfplumber's y-clustered lines).  
+        • Otherwise (flag off, pypdfium2 missing or PDFium text rejected) nothing from PDFium is used:
+          pages come from pdfplumber, whose layout the header/order regexes were written for, and the
+          segment from `pdfminer.six.extract_text()`, as in the original M02 parser.
+    """
+    if USE_PDFIUM_TEXT and pdfium is not None:
+        pages = list(_iter_page_text(pdf_path))
+        text = "\n".join(pages)
+        if _pdfium_text_usable(pages, text):
+            return pages, get_segment_text(text)
+
+    # Lazy: pdfminer and pdfplumber are slow to import and only needed on this fallback
+    from processes.P00_set_packages import extract_text, pdfplumber
+    segment = get_segment_text(extract_text(str(pdf_path)))
+    with pdfplumber.open(pdf_path) as pdf:
+        return [p.extract_text() or "" for p in pdf.pages], segment
+
 
 # ====================================================================================================
-# 5. MAIN PARSER FUNCTION
+# 5. PER-PDF PROCESSING
+# ----------------------------------------------------------------------------------------------------
+# Steps 5–9 for a single statement, as top-level functions so they can run in ProcessPoolExecutor
+# workers (picklable on Windows' spawn start method as well as fork).
+# ====================================================================================================
+
+def _parse_statement(pdf_path: Path):
+    """
+    Extract orders, refunds, commission and marketing rows from one JE statement PDF.
+
+    Args:
+        pdf_path (Path): Full path to the Just Eat PDF statement.
+
+    Returns:
+        tuple[list[pandas.DataFrame], list[tuple]]: Row fragments (orders, refunds) sharing
+            `_ROW_COLUMNS`, and the commission/marketing rows as plain tuples in the same column
+            order; both empty if the statement is skipped. The caller builds one frame from every
+            PDF's tuples and concatenates everything in one pass.
+
+    Notes:
+        • Writes the per-statement refund detail CSV (a unique path per PDF, so safe in parallel).
+        • Progress and validation output is printed; `process_single_pdf()` captures it.
+        • Date-range selection is done from filenames in run_je_parser (STEP 4) before any PDF is
+          opened, so statements reaching this function are not re-checked against the GUI window.
+    """
+    print(f"\n📄 Processing: {pdf_path.name}")
+
+    # Extract full text
+    full_text_pages, segment_text = _read_statement_text(pdf_path)
+    full_text = "\n".join(full_text_pages)
+
+    # Detect statement period
+    m_period = None
+    for page_text in full_text_pages:
+        for pat in _PERIOD_RES:
+            m_period = pat.search(page_text)
+            if m_period:
+                break
+        if m_period:
+            break
+    statement_start_raw = m_period.group(1) if m_period else None
+    statement_end_raw   = m_period.group(2) if m_period else None
+
+    statement_start = parse_date_safe(statement_start_raw)
+    statement_end   = parse_date_safe(statement_end_raw)
+    if not statement_start or not statement_end:
+        print("  ⚠ Could not extract statement period → skipping.")
+        return [], []
+
+    # Header fields for validation
+    header = _scan_header_fields(full_text)
+    orders_n, sales_n, recv_n = header["orders_n"], header["sales_n"], header["recv_n"]
+
+    reported_order_count = int(orders_n.replace(",", "")) if orders_n else None
+    reported_total_sales = float(sales_n.replace(",", "")) if sales_n else None
+    reported_you_receive = float(recv_n.replace(",", "")) if recv_n else None
+    payment_date_raw     = header["pay_d"]
+
+    try:
+        payment_date = datetime.strptime(payment_date_raw, "%d %b %Y").date() if payment_date_raw else None
+    except Exception:
+        payment_date = None
+
+    # Extract orders
+    ids, dates, order_types, totals = [], [], [], []
+
+    for m in _ORDER_LINE_RE.finditer(full_text):
+        date, order_id, order_type, total = m.groups()
+        ids.append(order_id)
+        dates.append(date)
+        order_types.append(order_type)
+        totals.append(float(total.replace(",", "")))
+
+    # Convert to DataFrame (one list per column; statement-level values are broadcast)
+    orders_df = pd.DataFrame({
+        "order_id": ids,
+        "date": dates,
+        "order_type": order_types,
+        "total_incl_vat": np.asarray(totals, dtype=np.float64),
+        "refund_amount": 0.0,
+        "type": "Order",
+        "source_file": pdf_path.name,
+        "statement_start": statement_start,
+        "statement_end": statement_end,
+        "payment_date": payment_date,
+    })
+    # Order dates ("dd/mm/yy") become date objects in one vectorised pass, matching the other row types
+    orders_df["date"] = pd.to_datetime(orders_df["date"], format="%d/%m/%y", errors="coerce").dt.date
+    parsed_order_count = len(orders_df)
+    parsed_total_sales = round(orders_df["total_incl_vat"].sum(), 2)
+
+    # =================================================================================================
+    # STEP 6: Extract Refund, Commission, and Marketing Details
+    # =================================================================================================
+    df_full = build_dataframe(*extract_entries(segment_text))
+
+    # One literal (non-regex) scan of the descriptions, reused for both totals
+    is_commission = df_full["description"].str.contains("Commission", case=False, na=False, regex=False)
+    amounts = df_full["amount"]
+    commission_sum = amounts[is_commission].sum()
+    marketing_sum = amounts[~is_commission & df_full["reason"].eq("")].sum()
+
+    commission_incl_vat = round(commission_sum * 1.20 * -1, 2)
+    marketing_incl_vat  = round(marketing_sum * 1.20 * -1, 2)
+
+    # ---------------------------------------------------------------------------------------------
+    # STEP 6.1 – Save per-statement refund detail CSV
+    # ---------------------------------------------------------------------------------------------
+    if not df_full.empty:
+        refund_csv_path = REFUND_FOLDER / f"{pdf_path.stem}_RefundDetails.csv"
+        (
+            df_full.assign(
+                source_file=pdf_path.name,
+                statement_start=statement_start,
+                statement_end=statement_end,
+                payment_date=payment_date,
+            )
+            .to_csv(refund_csv_path, index=False)
+        )
+        print(f"   💾 Saved refund detail → {refund_csv_path}")
+
+    # =================================================================================================
+    # STEP 7: Aggregate Refunds by Order
+    # =================================================================================================
+    if not df_full.empty:
+        df_refunds_by_order = (
+            df_full[df_full["outside_scope"] & df_full["order_number"].ne("")]
+            .groupby("order_number", as_index=False)["amount"]
+            .sum()
+            .rename(columns={"order_number": "order_id"})
+        )
+    else:
+        df_refunds_by_order = pd.DataFrame(columns=["order_id", "amount"])
+
+    # =================================================================================================
+    # STEP 8: Combine Orders, Refunds, Commission, and Marketing
+    # =================================================================================================
+    combined_rows = [orders_df]  # pd.concat in STEP 10 copies, so no defensive copy here
+
+    # Add refund rows (assign builds a new frame; df_refunds_by_order is still needed for STEP 9)
+    if not df_refunds_by_order.empty:
+        refund_rows = df_refunds_by_order.assign(
+            refund_amount=-df_refunds_by_order["amount"],
+            total_incl_vat=0.0,
+            type="Refund",
+            date=statement_start,
+            order_type="Refund",
+            source_file=pdf_path.name,
+            statement_start=statement_start,
+            statement_end=statement_end,
+            payment_date=payment_date,
+        )
+        combined_rows.append(refund_rows[list(_ROW_COLUMNS)])  # Same column order (drops "amount") → fast concat path
+
+    # Add commission and marketing (at most two rows; plain tuples in _ROW_COLUMNS order, no DataFrame)
+    extra_rows = [
+        (
+            "", statement_start, label, incl_vat, 0.0, label,
+            pdf_path.name, statement_start, statement_end, payment_date,
+        )
+        for label, net, incl_vat in (
+            ("Commission", commission_sum, commission_incl_vat),
+            ("Marketing", marketing_sum, marketing_incl_vat),
+        )
+        if net != 0
+    ]
+
+    # =================================================================================================
+    # STEP 9: Per-Statement Validation
+    # =================================================================================================
+    refund_sum_lines = df_refunds_by_order["amount"].sum() if not df_refunds_by_order.empty else 0.0
+    subtotal_all = df_full["amount"].sum() if not df_full.empty else 0.0
+    vat_deductions = df_full.loc[~df_full["outside_scope"], "amount"].sum() if not df_full.empty else 0.0
+    refund_total_calc = subtotal_all - vat_deductions
+    refund_sum_lines_signed = -refund_sum_lines
+
+    derived_receive = diff_receive = None
+    if reported_total_sales is not None and reported_you_receive is not None:
+        derived_receive = (
+            reported_total_sales
+            + refund_sum_lines_signed
+            + commission_incl_vat
+            + marketing_incl_vat
+        )
+        diff_receive = round(derived_receive - reported_you_receive, 2)
+
+    # Validation summary
+    print(f"   Header Orders: {reported_order_count:,} | Parsed Orders: {parsed_order_count:,}")
+    print(f"   Header Total Sales: £{reported_total_sales:,.2f} | Parsed: £{parsed_total_sales:,.2f}")
+    print(f"   Refund variance: £{refund_sum_lines_signed + refund_total_calc:+.2f}")
+    print(f"   Header Payout: £{reported_you_receive:,.2f} | Parsed: £{derived_receive:,.2f} → Δ £{diff_receive:+.2f}")
+    print(f"   Commission + VAT: £{commission_incl_vat:,.2f} | Marketing + VAT: £{marketing_incl_vat:,.2f}")
+    if payment_date:
+        print(f"   💰 Payment Date: {payment_date.strftime('%d %b %Y')}")
+
+    return combined_rows, extra_rows
+
+
+def process_single_pdf(pdf_path: Path):
+    """
+    Process one statement PDF and capture its console output.
+
+    Args:
+        pdf_path (Path): Full path to the Just Eat PDF statement.
+
+    Returns:
+        tuple[list[pandas.DataFrame], list[tuple], str]: (row fragments, commission/marketing row
+            tuples, both empty if skipped; captured log text)
+
+    Notes:
+        • Output is buffered per PDF and printed by the parent in input order, so logs from parallel
+          workers never interleave.
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        frames, extra_rows = _parse_statement(pdf_path)
+    return frames, extra_rows, buf.getvalue()
+
+
+# ====================================================================================================
+# 6. MAIN PARSER FUNCTION
 # ----------------------------------------------------------------------------------------------------
 # Step 2 – Core orchestration of PDF parsing, extraction, and consolidation.
 # ====================================================================================================
 
 def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None, end_date: str = None):
     """
-    Parse all weekly Just Eat Statement PDFs and produce a consolidated CSV.
+    Parse all weekly Just Eat Statement PDFs and produce a consolidated Order Level Detail file.
 
     Args:
         pdf_folder (Path): Folder containing weekly JE Statement PDFs.  
-        output_folder (Path): Destination for the consolidated output CSV.  
+        output_folder (Path): Destination for the consolidated output file.  
         start_date (str, optional): Inclusive start date (YYYY-MM-DD).  
         end_date (str, optional): Inclusive end date (YYYY-MM-DD).
 
@@ -250,7 +775,7 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
         2️⃣ Filter by accounting period (GUI dates).  
         3️⃣ Extract orders, refunds, commission & marketing.  
         4️⃣ Validate parsed totals against PDF headers.  
-        5️⃣ Merge everything into one “JE Order Level Detail.csv”.
+        5️⃣ Merge everything into one “JE Order Level Detail.csv” (plus a Parquet copy).
 
     Notes:
         • Handles missing or malformed PDFs gracefully.  
@@ -273,18 +798,31 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
     # ---------------------------------------------------------------------------------------------
     # STEP 2: Locate all JE Statement PDFs
     # ---------------------------------------------------------------------------------------------
-    pdf_files = sorted(pdf_folder.glob("*JE Statement*.pdf"))
-    if not pdf_files:
+    # One os.scandir pass over the folder; entries stay as (name, path) strings and only the
+    # statements kept by STEP 4 are promoted to Path objects.
+    try:
+        with os.scandir(pdf_folder) as it:
+            stmt_entries = sorted(
+                (entry.name, entry.path)
+                for entry in it
+                if fnmatch.fnmatch(entry.name, "*JE Statement*.pdf") and entry.is_file()
+            )
+    except FileNotFoundError:
+        stmt_entries = []
+    if not stmt_entries:
         raise FileNotFoundError(f"No matching PDFs found in: {pdf_folder}")
 
-    print(f"📂 Found {len(pdf_files)} PDF(s).")
+    print(f"📂 Found {len(stmt_entries)} PDF(s).")
     if gui_start and gui_end:
         print(f"📅 Restricting to PDFs overlapping {gui_start} → {gui_end}")
 
     # ---------------------------------------------------------------------------------------------
     # STEP 3: Determine JE coverage window
     # ---------------------------------------------------------------------------------------------
-    first_monday, last_monday = get_je_statement_coverage(pdf_folder, gui_start, gui_end)
+    # Reuse the STEP 2 listing rather than scanning the folder again
+    first_monday, last_monday = get_je_statement_coverage(
+        pdf_folder, gui_start, gui_end, names=[name for name, _ in stmt_entries]
+    )
     if not first_monday or not last_monday:
         raise FileNotFoundError(f"No JE statements overlap {gui_start} → {gui_end} in {pdf_folder}")
     print(f"📅 JE statements within selected range: {first_monday} → {last_monday}")
@@ -292,249 +830,45 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
     # ---------------------------------------------------------------------------------------------
     # STEP 4: Filter PDFs by date range (overlap check)
     # ---------------------------------------------------------------------------------------------
-    valid_files = []
-    for pdf_path in sorted(pdf_folder.glob("*JE Statement*.pdf")):
-        m = re.search(r"(\d{2})\.(\d{2})\.(\d{2})", pdf_path.name)
+    # Reuses the STEP 2 listing; the filename date is built straight from its integer parts and
+    # compared as a date object
+    pdf_files = []
+    for name, path in stmt_entries:
+        m = _FILE_DATE_RE.search(name)
         if not m:
             continue
-        start = datetime.strptime(f"20{m.group(1)}-{m.group(2)}-{m.group(3)}", "%Y-%m-%d").date()
+        yy, mm, dd = map(int, m.groups())
+        start = date(2000 + yy, mm, dd)
         end = start + timedelta(days=6)
-        if statement_overlaps_file(str(start), str(end), str(gui_start), str(gui_end)):
-            valid_files.append(pdf_path)
+        if not (end < gui_start or start > gui_end):
+            pdf_files.append(Path(path))
         else:
-            print(f"⏭ Skipped {pdf_path.name} (covers {start} → {end})")
-    pdf_files = valid_files
+            print(f"⏭ Skipped {name} (covers {start} → {end})")
     print(f"📄 {len(pdf_files)} PDF(s) selected for processing.")
 
     # =================================================================================================
-    # STEP 5: Iterate through each PDF
+    # STEP 5: Process each PDF (Steps 5–9 per statement, in parallel across processes)
     # =================================================================================================
+    # Each statement is independent and parsing is CPU-bound. Results (and their buffered logs) are
+    # consumed in input order, so the console output matches a serial run.
     all_rows = []
-
-    for pdf_path in pdf_files:
-        print(f"\n📄 Processing: {pdf_path.name}")
-
-        # Extract full text
-        with pdfplumber.open(pdf_path) as pdf:
-            full_text_pages = [p.extract_text() or "" for p in pdf.pages]
-        full_text = "\n".join(full_text_pages)
-
-        # Detect statement period
-        period_patterns = [
-            re.compile(r"(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})\s*[-–to]+\s*(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I),
-            re.compile(r"(\d{1,2}/\d{1,2}/\d{2,4})\s*[-–to]+\s*(\d{1,2}/\d{1,2}/\d{2,4})", re.I),
-        ]
-        m_period = None
-        for page_text in full_text_pages:
-            for pat in period_patterns:
-                m_period = pat.search(page_text)
-                if m_period:
-                    break
-            if m_period:
-                break
-        statement_start_raw = m_period.group(1) if m_period else None
-        statement_end_raw   = m_period.group(2) if m_period else None
-
-        def parse_date_safe(date_str):
-            """Safely parse varied date formats to datetime.date or None."""
-            if not date_str:
-                return None
-            for fmt in ("%d %b %Y", "%d %B %Y", "%d/%m/%Y", "%d/%m/%y"):
-                try:
-                    return datetime.strptime(date_str.strip(), fmt).date()
-                except Exception:
-                    continue
-            return None
-
-        statement_start = parse_date_safe(statement_start_raw)
-        statement_end   = parse_date_safe(statement_end_raw)
-        if not statement_start or not statement_end:
-            print("  ⚠ Could not extract statement period → skipping.")
-            continue
-
-        # Header fields for validation
-        orders_count_pat = re.compile(r"Number\s+of\s+orders\s+([\d,]+)", re.I)
-        total_sales_pat = re.compile(r"Total\s+sales.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
-        you_receive_pat = re.compile(r"You\s+will\s+receive.*?£\s*([\d,]+\.\d{2})", re.I | re.S)
-        payment_date_pat = re.compile(r"paid\s+on\s+(\d{1,2}\s+[A-Za-z]{3,}\s+\d{4})", re.I)
-
-        m_orders = orders_count_pat.search(full_text)
-        m_sales  = total_sales_pat.search(full_text)
-        m_recv   = you_receive_pat.search(full_text)
-        m_payment = payment_date_pat.search(full_text)
-
-        reported_order_count = int(m_orders.group(1).replace(",", "")) if m_orders else None
-        reported_total_sales = float(m_sales.group(1).replace(",", "")) if m_sales else None
-        reported_you_receive = float(m_recv.group(1).replace(",", "")) if m_recv else None
-        payment_date_raw     = m_payment.group(1) if m_payment else None
-
-        try:
-            payment_date = datetime.strptime(payment_date_raw, "%d %b %Y").date() if payment_date_raw else None
-        except Exception:
-            payment_date = None
-
-        # Skip PDFs outside range
-        if gui_start and gui_end:
-            if statement_end < gui_start or statement_start > gui_end:
-                print(f"  ⏭ Skipped ({statement_start} → {statement_end})")
-                continue
-
-        # Extract orders
-        line_prefix  = re.compile(r"^\s*\d+\s+(\d{2}/\d{2}/\d{2})\s+(\d+)\s+([A-Za-z/&\-]+)\s+(.*)$", re.M)
-        money_finder = re.compile(r"[£]\s*([\d.,]+)")
-        orders_data  = []
-
-        for m in line_prefix.finditer(full_text):
-            date, order_id, order_type, tail = m.groups()
-            amts = money_finder.findall(tail)
-            if not amts:
-                continue
-            total = float(amts[-1].replace(",", ""))
-            orders_data.append({
-                "order_id": order_id,
-                "date": date,
-                "order_type": order_type,
-                "total_incl_vat": total,
-                "refund_amount": 0.0,
-                "type": "Order",
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date,
-            })
-
-        # Convert to DataFrame
-        orders_df = pd.DataFrame(orders_data)
-        parsed_order_count = len(orders_df)
-        parsed_total_sales = round(orders_df["total_incl_vat"].sum(), 2)
-
-        # =================================================================================================
-        # STEP 6: Extract Refund, Commission, and Marketing Details
-        # =================================================================================================
-        seg = get_segment_text(pdf_path)
-        descriptions = extract_descriptions(seg)
-        amounts = extract_amounts(seg)
-        df_full = build_dataframe(descriptions, amounts)
-
-        commission_sum = df_full[df_full["description"].str.contains("Commission", case=False, na=False)]["amount"].sum()
-        marketing_sum = df_full[
-            (~df_full["description"].str.contains("Commission", case=False, na=False))
-            & (df_full["reason"].eq(""))
-        ]["amount"].sum()
-
-        commission_incl_vat = round(commission_sum * 1.20 * -1, 2)
-        marketing_incl_vat  = round(marketing_sum * 1.20 * -1, 2)
-
-        # ---------------------------------------------------------------------------------------------
-        # STEP 6.1 – Save per-statement refund detail CSV
-        # ---------------------------------------------------------------------------------------------
-        if not df_full.empty:
-            refund_csv_path = REFUND_FOLDER / f"{pdf_path.stem}_RefundDetails.csv"
-            (
-                df_full.assign(
-                    source_file=pdf_path.name,
-                    statement_start=statement_start,
-                    statement_end=statement_end,
-                    payment_date=payment_date,
-                )
-                .to_csv(refund_csv_path, index=False)
-            )
-            print(f"   💾 Saved refund detail → {refund_csv_path}")
-
-        # =================================================================================================
-        # STEP 7: Aggregate Refunds by Order
-        # =================================================================================================
-        if not df_full.empty:
-            df_refunds_by_order = (
-                df_full[df_full["outside_scope"] & df_full["order_number"].ne("")]
-                .groupby("order_number", as_index=False)["amount"]
-                .sum()
-                .rename(columns={"order_number": "order_id"})
-            )
+    extra_rows = []
+    n_pdfs = len(pdf_files)
+    with contextlib.ExitStack() as stack:
+        if n_pdfs > 1:
+            ex = stack.enter_context(ProcessPoolExecutor(max_workers=min(n_pdfs, os.cpu_count() or 1)))
+            results = ex.map(process_single_pdf, pdf_files)
         else:
-            df_refunds_by_order = pd.DataFrame(columns=["order_id", "amount"])
-
-        # =================================================================================================
-        # STEP 8: Combine Orders, Refunds, Commission, and Marketing
-        # =================================================================================================
-        order_rows = orders_df.copy()
-        combined_rows = [order_rows]
-
-        # Add refund rows
-        if not df_refunds_by_order.empty:
-            refund_rows = df_refunds_by_order.copy()
-            refund_rows["refund_amount"] = refund_rows["amount"].apply(lambda x: -x)
-            refund_rows["total_incl_vat"] = 0.0
-            refund_rows["type"] = "Refund"
-            refund_rows["date"] = statement_start
-            refund_rows["order_type"] = "Refund"
-            refund_rows["source_file"] = pdf_path.name
-            refund_rows["statement_start"] = statement_start
-            refund_rows["statement_end"] = statement_end
-            refund_rows["payment_date"] = payment_date
-            refund_rows.drop(columns=["amount"], inplace=True)
-            combined_rows.append(refund_rows)
-
-        # Add commission
-        if commission_sum != 0:
-            combined_rows.append(pd.DataFrame([{
-                "order_id": "",
-                "date": statement_start,
-                "order_type": "Commission",
-                "refund_amount": 0.0,
-                "type": "Commission",
-                "total_incl_vat": commission_incl_vat,
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date,
-            }]))
-
-        # Add marketing
-        if marketing_sum != 0:
-            combined_rows.append(pd.DataFrame([{
-                "order_id": "",
-                "date": statement_start,
-                "order_type": "Marketing",
-                "refund_amount": 0.0,
-                "type": "Marketing",
-                "total_incl_vat": marketing_incl_vat,
-                "source_file": pdf_path.name,
-                "statement_start": statement_start,
-                "statement_end": statement_end,
-                "payment_date": payment_date,
-            }]))
-
-        combined_df = pd.concat(combined_rows, ignore_index=True)
-        all_rows.append(combined_df)
-
-        # =================================================================================================
-        # STEP 9: Per-Statement Validation
-        # =================================================================================================
-        refund_sum_lines = df_refunds_by_order["amount"].sum() if not df_refunds_by_order.empty else 0.0
-        subtotal_all = df_full["amount"].sum() if not df_full.empty else 0.0
-        vat_deductions = df_full.loc[~df_full["outside_scope"], "amount"].sum() if not df_full.empty else 0.0
-        refund_total_calc = subtotal_all - vat_deductions
-        refund_sum_lines_signed = -refund_sum_lines
-
-        derived_receive = diff_receive = None
-        if reported_total_sales is not None and reported_you_receive is not None:
-            derived_receive = (
-                reported_total_sales
-                + refund_sum_lines_signed
-                + commission_incl_vat
-                + marketing_incl_vat
-            )
-            diff_receive = round(derived_receive - reported_you_receive, 2)
+            results = map(process_single_pdf, pdf_files)
 
-        # Validation summary
-        print(f"   Header Orders: {reported_order_count:,} | Parsed Orders: {parsed_order_count:,}")
-        print(f"   Header Total Sales: £{reported_total_sales:,.2f} | Parsed: £{parsed_total_sales:,.2f}")
-        print(f"   Refund variance: £{refund_sum_lines_signed + refund_total_calc:+.2f}")
-        print(f"   Header Payout: £{reported_you_receive:,.2f} | Parsed: £{derived_receive:,.2f} → Δ £{diff_receive:+.2f}")
-        print(f"   Commission + VAT: £{commission_incl_vat:,.2f} | Marketing + VAT: £{marketing_incl_vat:,.2f}")
-        if payment_date:
-            print(f"   💰 Payment Date: {payment_date.strftime('%d %b %Y')}")
+        for frames, extras, log_text in results:
+            print(log_text, end="")
+            all_rows.extend(frames)
+            extra_rows.extend(extras)
+
+    # Commission/marketing rows from every statement become one frame (one dtype inference in total)
+    if extra_rows:
+        all_rows.append(pd.DataFrame.from_records(extra_rows, columns=list(_ROW_COLUMNS)))
 
     # =================================================================================================
     # STEP 10: Merge and Save Consolidated Output
@@ -544,25 +878,40 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
         print(msg)
         return msg
 
+    # Single concat over every fragment from every PDF (no intermediate per-statement frames)
     merged_all = pd.concat(all_rows, ignore_index=True)
-    merged_all = merged_all.sort_values(by=["statement_start", "order_id", "type"]).reset_index(drop=True)
-
-    first_monday = pd.to_datetime(merged_all["statement_start"]).dt.date.min()
-    last_monday = pd.to_datetime(merged_all["statement_start"]).dt.date.max()
-    file_name = f"{first_monday:%y.%m.%d} - {last_monday:%y.%m.%d} - JE Order Level Detail.csv"
-    orders_csv = OUTPUT_FOLDER / file_name
+    all_rows.clear()  # Drop the per-PDF fragments now, so they are not held alongside the merged copy
+    # Low-cardinality text columns → category (integer-coded sort keys; stored dictionary-encoded in Parquet)
+    for col in ("type", "order_type", "source_file"):
+        merged_all[col] = merged_all[col].astype("category")
+    merged_all.sort_values(by=["statement_start", "order_id", "type"], inplace=True, ignore_index=True)
+
+    # Rows are sorted by statement_start (plain date objects), so the range is the first and last row
+    first_monday = merged_all["statement_start"].iat[0]
+    last_monday = merged_all["statement_start"].iat[-1]
+    file_name = f"{first_monday:%y.%m.%d} - {last_monday:%y.%m.%d} - {JE_ORDER_DETAIL_KEYWORD}.csv"
+    orders_out = OUTPUT_FOLDER / file_name
 
     merged_all.rename(columns=JET_COLUMN_RENAME_MAP, inplace=True, errors="ignore")
     merged_all["je_order_id"] = (
         merged_all["je_order_id"]
         .astype(str)
-        .str.strip()
-        .str.replace(r"\.0$", "", regex=True)
-        .str.replace(r"[^0-9]", "", regex=True)
+        .str.replace(_JE_ID_CLEAN_RE, "", regex=True)
     )
 
-    merged_all.to_csv(orders_csv, index=False)
-    print(f"\n💾 Saved consolidated file → {orders_csv}")
+    # The CSV is the reconciliation boundary: M03 and the GUI's coverage scan only read this file.
+    # pyarrow's multithreaded CSV writer replaces the pandas one when installed; pd.read_csv gives M03
+    # the same frame back (floats with no fraction are written as "15" instead of "15.0").
+    # The zstd Parquet copy keeps the binary (no float → text) version for fast reloads.
+    try:
+        import pyarrow as pa  # Lazy: optional dependency, only needed for these two writes
+        import pyarrow.csv as pacsv
+    except ImportError:
+        merged_all.to_csv(orders_out, index=False)
+    else:
+        pacsv.write_csv(pa.Table.from_pandas(merged_all, preserve_index=False), str(orders_out))
+        merged_all.to_parquet(orders_out.with_suffix(".parquet"), compression="zstd", index=False)
+    print(f"\n💾 Saved consolidated file → {orders_out}")
 
     # =================================================================================================
     # STEP 11: Global Summary
@@ -582,11 +931,11 @@ def run_je_parser(pdf_folder: Path, output_folder: Path, start_date: str = None,
     print(f"Net after refund: £{net_after_refunds:,.2f}")
     print("======================================================")
 
-    return orders_csv
+    return orders_out
 
 
 # ====================================================================================================
-# 6. MAIN EXECUTION BLOCK
+# 7. MAIN EXECUTION BLOCK
 # ----------------------------------------------------------------------------------------------------
 # Allows the module to run independently for debugging or CLI testing.
 # ====================================================================================================
@@ -53,6 +53,7 @@ sys.dont_write_bytecode = True
 
 # Import the shared project-level package set (tkinter, pandas, pdfplumber, datetime, etc.)
 from processes.P00_set_packages import *
+from processes.P00_set_packages import pdfplumber, extract_text   # Lazily loaded by the hub, so not part of *
 
 # Import core path constants from P01
 from processes.P01_set_file_paths import (
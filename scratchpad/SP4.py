@@ -39,6 +39,7 @@ from processes.P00_set_packages import *
 # ====================================================================================================
 
 from processes.P00_set_packages import *
+from processes.P00_set_packages import pdfplumber, extract_text   # Lazily loaded by the hub, so not part of *
 from processes.P01_set_file_paths import provider_pdf_folder, provider_pdf_unprocessed_folder, provider_output_folder, provider_refund_folder
 from processes.P03_shared_functions import statement_overlaps_file, get_je_statement_coverage
 from processes.P04_static_lists import JET_COLUMN_RENAME_MAP